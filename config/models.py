@@ -5,11 +5,16 @@ Centralized model definitions used across all services and tools.
 Change models here to update them everywhere.
 """
 
+from typing import Final
+
+from config.settings import get_settings
+
 # LLM Models (for text generation)
-LLM_MODEL = "tngtech/tng-r1t-chimera:free"
+# Set LLM_MODEL_OVERRIDE (environment or .env) to switch models without editing this file.
+LLM_MODEL: Final[str] = get_settings().llm_model_override or "tngtech/tng-r1t-chimera:free"
 
 # Image Models (for image generation)
-IMAGE_MODEL = "google/gemini-3-pro-image-preview"
+IMAGE_MODEL: Final[str] = "google/gemini-3-pro-image-preview"
 
 # Uncomment to override defaults:
 # LLM_MAX_TOKENS = 1024
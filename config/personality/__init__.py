@@ -1,19 +1,146 @@
 """
 Personality module - Combines all personality parts into SYSTEM_PROMPT.
+
+Parts and the combined prompt are loaded lazily on first attribute access
+(PEP 562), so importing the package alone costs nothing.
+
+SYSTEM_PROMPT is read from the generated _compiled.py when its digest still
+matches the source files, and assembled from the parts otherwise, so edits
+take effect even before scripts/compile_personality.py is re-run.
 """
 
-from config.personality.backstory import BACKSTORY
-from config.personality.beliefs import BELIEFS
-from config.personality.instructions import INSTRUCTIONS
-from config.personality.sample_tweets import SAMPLE_TWEETS
-from config.personality.never_say import NEVER_SAY
-
-# Combine all parts into the final system prompt
-SYSTEM_PROMPT = f"""{BACKSTORY}
-{BELIEFS}
-{INSTRUCTIONS}
-{NEVER_SAY}
-{SAMPLE_TWEETS}
+import hashlib
+import importlib
+import logging
+import sys
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Personality part -> submodule that defines it
+_PARTS = {
+    "BACKSTORY": "backstory",
+    "BELIEFS": "beliefs",
+    "INSTRUCTIONS": "instructions",
+    "SAMPLE_TWEETS": "sample_tweets",
+    "NEVER_SAY": "never_say"
+}
+
+# Parts that make up SYSTEM_PROMPT (SAMPLE_TWEETS is deliberately excluded)
+_PROMPT_PARTS = ("BACKSTORY", "BELIEFS", "INSTRUCTIONS", "NEVER_SAY")
+
+# Names derived from the combined prompt
+_PROMPT_EXPORTS = {"SYSTEM_PROMPT", "SYSTEM_PROMPT_STR", "SYSTEM_PROMPT_BYTES", "SYSTEM_PROMPT_BLOCKS"}
+
+
+def _load_part(name: str) -> str:
+    module = importlib.import_module(f"{__name__}.{_PARTS[name]}")
+    return getattr(module, name)
+
+
+def source_digest() -> str:
+    """Hash of the files SYSTEM_PROMPT is built from (parts + this template)."""
+    package_dir = Path(__file__).parent
+    digest = hashlib.blake2b(digest_size=16)
+    for path in [package_dir / f"{_PARTS[name]}.py" for name in _PROMPT_PARTS] + [Path(__file__)]:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def assemble_system_prompt() -> str:
+    """Build SYSTEM_PROMPT from the personality parts."""
+    # SAMPLE_TWEETS is not included: repeats are rejected after generation
+    # by utils.dedupe instead of spending prompt tokens on them.
+    return f"""{_load_part("BACKSTORY")}
+{_load_part("BELIEFS")}
+{_load_part("INSTRUCTIONS")}
+{_load_part("NEVER_SAY")}
 """
 
-__all__ = ["SYSTEM_PROMPT", "BACKSTORY", "BELIEFS", "INSTRUCTIONS", "SAMPLE_TWEETS", "NEVER_SAY"]
+
+def _load_system_prompt() -> str:
+    """Use the precompiled prompt if it is current, else assemble from source."""
+    try:
+        from config.personality import _compiled
+    except ImportError:
+        return assemble_system_prompt()
+
+    # Checked once per process, since the result is cached by __getattr__
+    if _compiled.SOURCE_DIGEST != source_digest():
+        logger.warning("[PERSONALITY] _compiled.py is stale - assembling from source")
+        return assemble_system_prompt()
+
+    return _compiled.SYSTEM_PROMPT
+
+
+def _build_prompt_exports() -> dict[str, Any]:
+    system_prompt = _load_system_prompt()
+
+    # Interned so identity checks in memoization layers are O(1)
+    system_prompt = sys.intern(system_prompt)
+
+    return {
+        "SYSTEM_PROMPT": system_prompt,
+        # Plain string form (for providers without prompt caching)
+        "SYSTEM_PROMPT_STR": system_prompt,
+        # UTF-8 encoded once for callers that send raw bytes
+        "SYSTEM_PROMPT_BYTES": system_prompt.encode("utf-8"),
+        # Content-block form with an Anthropic cache breakpoint after the static personality
+        "SYSTEM_PROMPT_BLOCKS": [
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }
+        ]
+    }
+
+
+def _count_tokens(text: str) -> int:
+    """Token count with tiktoken if installed, else a ~4 chars/token estimate."""
+    try:
+        import tiktoken
+    except ImportError:
+        return len(text) // 4
+
+    return len(tiktoken.get_encoding("cl100k_base").encode(text))
+
+
+def __getattr__(name: str) -> Any:
+    if name == "SYSTEM_PROMPT_TOKENS":
+        # Computed separately so prompt access never pays for tokenization
+        system_prompt = globals().get("SYSTEM_PROMPT") or __getattr__("SYSTEM_PROMPT")
+        value = _count_tokens(system_prompt)
+        globals()[name] = value
+        return value
+
+    if name in _PARTS:
+        value = _load_part(name)
+        globals()[name] = value
+        return value
+
+    if name in _PROMPT_EXPORTS:
+        exports = _build_prompt_exports()
+        globals().update(exports)
+        return exports[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [
+    "SYSTEM_PROMPT",
+    "SYSTEM_PROMPT_STR",
+    "SYSTEM_PROMPT_BYTES",
+    "SYSTEM_PROMPT_BLOCKS",
+    "SYSTEM_PROMPT_TOKENS",
+    "BACKSTORY",
+    "BELIEFS",
+    "INSTRUCTIONS",
+    "SAMPLE_TWEETS",
+    "NEVER_SAY"
+]
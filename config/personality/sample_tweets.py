@@ -1,7 +1,8 @@
 """
 Sample tweets that the bot has already made.
 
-These are injected into the prompt to help the LLM avoid repetition.
+Used by utils.dedupe to reject near-copies of these tweets after generation.
+SAMPLE_TWEETS keeps the prompt-formatted version for callers that want it.
 """
 
 # List of sample tweets
@@ -12,6 +13,6 @@ if SAMPLE_TWEETS_LIST:
     SAMPLE_TWEETS = """
 ## TWEETS YOU ALREADY MADE (DON'T REPEAT THESE)
 
-""" + "\n".join(f"- {tweet}" for tweet in SAMPLE_TWEETS_LIST)
+""" + "\n".join(["- " + tweet for tweet in SAMPLE_TWEETS_LIST])
 else:
     SAMPLE_TWEETS = ""
@@ -6,16 +6,103 @@ Contains prompt templates for:
 - mention_selector.py: Legacy mention selector (v1.2)
 - mention_selector_agent.py: Agent-based mention selection (v1.3)
 - mention_reply_agent.py: Agent-based mention reply planning (v1.3)
+- unified_agent.py: Unified agent instructions
+
+Templates are imported lazily on first attribute access (PEP 562).
 """
 
-from config.prompts.agent_autopost import AUTOPOST_AGENT_PROMPT
-from config.prompts.mention_selector import MENTION_SELECTOR_PROMPT
-from config.prompts.mention_selector_agent import MENTION_SELECTOR_AGENT_PROMPT
-from config.prompts.mention_reply_agent import MENTION_REPLY_AGENT_PROMPT
+import importlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+# Prompt name -> submodule that defines it
+_PROMPTS = {
+    "AUTOPOST_AGENT_PROMPT": "agent_autopost",
+    "MENTION_SELECTOR_PROMPT": "mention_selector",
+    "MENTION_SELECTOR_AGENT_PROMPT": "mention_selector_agent",
+    "MENTION_REPLY_AGENT_PROMPT": "mention_reply_agent",
+    "AGENT_INSTRUCTIONS": "unified_agent",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Prompts:
+    """Immutable bundle of all prompt templates (available as PROMPTS)."""
+
+    autopost: str
+    mention_selector: str
+    mention_selector_agent: str
+    mention_reply_agent: str
+    unified_agent: str
+
+
+# Separator between sections of the unified agent system prompt
+SECTION_SEPARATOR = "\n\n---\n\n"
+
+
+@lru_cache(maxsize=1)
+def _unified_prefix() -> str:
+    """Static personality + agent instructions, built once."""
+    from config.personality import SYSTEM_PROMPT
+    from config.prompts.unified_agent import AGENT_INSTRUCTIONS
+
+    return "".join((SYSTEM_PROMPT, SECTION_SEPARATOR, AGENT_INSTRUCTIONS, SECTION_SEPARATOR))
+
+
+def build_system_segments(tools_desc: str, context: str) -> tuple[str, ...]:
+    """
+    Build the unified agent system prompt as cacheable segments.
+
+    Joined, the segments are personality, agent instructions, tools and
+    context separated by SECTION_SEPARATOR. They are kept apart so LLMClient
+    can put a prompt cache breakpoint after each segment: the static prefix
+    is shared by every cycle, the tools description changes only with the
+    tier, and the context is reused by every step of a cycle.
+
+    Args:
+        tools_desc: Tools description for the current tier.
+        context: Per-cycle context (recent actions, mentions, etc).
+
+    Returns:
+        Prompt segments, most static first.
+    """
+    return (_unified_prefix(), tools_desc + SECTION_SEPARATOR, context)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "PROMPTS":
+        value = Prompts(
+            autopost=__getattr__("AUTOPOST_AGENT_PROMPT"),
+            mention_selector=__getattr__("MENTION_SELECTOR_PROMPT"),
+            mention_selector_agent=__getattr__("MENTION_SELECTOR_AGENT_PROMPT"),
+            mention_reply_agent=__getattr__("MENTION_REPLY_AGENT_PROMPT"),
+            unified_agent=__getattr__("AGENT_INSTRUCTIONS")
+        )
+        globals()[name] = value
+        return value
+
+    if name in _PROMPTS:
+        module = importlib.import_module(f"{__name__}.{_PROMPTS[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "AUTOPOST_AGENT_PROMPT",
     "MENTION_SELECTOR_PROMPT",
     "MENTION_SELECTOR_AGENT_PROMPT",
     "MENTION_REPLY_AGENT_PROMPT",
+    "AGENT_INSTRUCTIONS",
+    "PROMPTS",
+    "Prompts",
+    "SECTION_SEPARATOR",
+    "build_system_segments",
 ]
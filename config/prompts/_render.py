@@ -0,0 +1,37 @@
+"""
+Rendering of multi-segment system prompts.
+
+System prompts are passed around as ordered segments (personality,
+instructions, tools description). Their rendered form depends only on the
+segments and on whether the provider supports prompt caching, so each
+combination is rendered once and reused.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=16)
+def render_system_prompt(segments: tuple[str, ...], prompt_cache: bool) -> str | list[dict[str, Any]]:
+    """
+    Render system prompt segments for a provider.
+
+    Args:
+        segments: Prompt segments, most static first.
+        prompt_cache: Whether the provider supports cache_control blocks.
+
+    Returns:
+        Joined string, or content blocks with one cache breakpoint per
+        segment (at most 4, as allowed by Anthropic). The result is shared
+        between calls and must not be mutated.
+    """
+    if not prompt_cache:
+        return "".join(segments)
+
+    parts = [part for part in segments if part]
+    if len(parts) > 4:
+        parts = ["".join(parts[:-3]), *parts[-3:]]
+    return [
+        {"type": "text", "text": part, "cache_control": {"type": "ephemeral"}}
+        for part in parts
+    ]
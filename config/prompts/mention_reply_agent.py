@@ -2,10 +2,12 @@
 Mention Reply Agent Prompt - Instructions for planning and generating replies.
 
 Used by MentionAgentHandler for planning tools and generating reply text.
-Contains {tools_desc} placeholder for dynamic tool injection.
+Fully static: the tools description is appended after it by the caller.
 """
 
-MENTION_REPLY_AGENT_PROMPT = """
+from typing import Final
+
+MENTION_REPLY_AGENT_PROMPT: Final[str] = """
 ---
 
 ## REPLY INSTRUCTIONS
@@ -19,10 +21,6 @@ You receive your recent mention replies. Don't repeat yourself:
 - If all replies are long -> try short
 - If all replies use the same tone -> vary it
 
-### Tools Available
-
-{tools_desc}
-
 ### Planning Rules
 
 1. In reasoning: think about what kind of reply fits this specific mention
@@ -42,4 +40,7 @@ You receive your recent mention replies. Don't repeat yourself:
 - Warm and genuine, not performative
 
 **Reply like you're texting a friend, not writing content.**
+
+Available tools are listed below.
+
 """
@@ -4,7 +4,9 @@ Mention Selector Prompt - Instructions for selecting and responding to mentions.
 Used by MentionHandler to choose which mention to reply to.
 """
 
-MENTION_SELECTOR_PROMPT = """
+from typing import Final
+
+MENTION_SELECTOR_PROMPT: Final[str] = """
 ## Selecting and Responding to Mentions
 
 You will receive a list of mentions (people who tagged you on Twitter). Your job:
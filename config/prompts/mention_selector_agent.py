@@ -4,7 +4,9 @@ Mention Selector Agent Prompt - Instructions for selecting which mentions to rep
 Used by MentionAgentHandler for first LLM call to pick mentions.
 """
 
-MENTION_SELECTOR_AGENT_PROMPT = """
+from typing import Final
+
+MENTION_SELECTOR_AGENT_PROMPT: Final[str] = """
 ---
 
 ## MENTION SELECTION INSTRUCTIONS
@@ -5,7 +5,9 @@ This prompt tells the agent how to use its tools and make decisions.
 Combined with SYSTEM_PROMPT (personality) to form full system message.
 """
 
-AGENT_INSTRUCTIONS = """
+from typing import Final
+
+AGENT_INSTRUCTIONS: Final[str] = """
 ## HOW YOU WORK
 
 You are an autonomous agent that runs periodically. Each cycle, you:
@@ -4,8 +4,13 @@ JSON Schemas - Structured output formats for LLM responses.
 All JSON schemas used for structured LLM output are defined here.
 """
 
+import json
+from typing import Any, Final
+
+from pydantic import BaseModel, ConfigDict
+
 # Schema for mention selection and response
-MENTION_SELECTOR_SCHEMA = {
+MENTION_SELECTOR_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "mention_selector",
@@ -37,7 +42,7 @@ MENTION_SELECTOR_SCHEMA = {
 }
 
 # Schema for agent plan generation
-PLAN_SCHEMA = {
+PLAN_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "agent_plan",
@@ -70,6 +75,10 @@ PLAN_SCHEMA = {
                                     "prompt": {
                                         "type": "string",
                                         "description": "Image prompt (for generate_image)"
+                                    },
+                                    "username": {
+                                        "type": "string",
+                                        "description": "Twitter handle without @ (for get_twitter_profile, get_conversation_history)"
                                     }
                                 },
                                 "additionalProperties": False
@@ -78,16 +87,20 @@ PLAN_SCHEMA = {
                         "required": ["tool", "params"],
                         "additionalProperties": False
                     }
+                },
+                "post_text": {
+                    "type": "string",
+                    "description": "If the plan is empty: the final tweet text (max 280 characters). Otherwise empty string."
                 }
             },
-            "required": ["reasoning", "plan"],
+            "required": ["reasoning", "plan", "post_text"],
             "additionalProperties": False
         }
     }
 }
 
 # Schema for final post text
-POST_TEXT_SCHEMA = {
+POST_TEXT_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "post_text",
@@ -109,7 +122,7 @@ POST_TEXT_SCHEMA = {
 # ==================== v1.3.0 Schemas ====================
 
 # Schema for mention selection (array of selected mentions)
-MENTION_SELECTION_SCHEMA = {
+MENTION_SELECTION_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "mention_selection",
@@ -152,7 +165,7 @@ MENTION_SELECTION_SCHEMA = {
 }
 
 # Schema for mention reply plan (agent decides tools freely)
-MENTION_PLAN_SCHEMA = {
+MENTION_PLAN_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "mention_plan",
@@ -202,7 +215,7 @@ MENTION_PLAN_SCHEMA = {
 }
 
 # Schema for final reply text
-REPLY_TEXT_SCHEMA = {
+REPLY_TEXT_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "reply_text",
@@ -224,7 +237,7 @@ REPLY_TEXT_SCHEMA = {
 # ==================== v1.4.0 Schemas ====================
 
 # Schema for agent reaction after tool execution (step-by-step)
-TOOL_REACTION_SCHEMA = {
+TOOL_REACTION_SCHEMA: Final[dict[str, Any]] = {
     "type": "json_schema",
     "json_schema": {
         "name": "tool_reaction",
@@ -242,3 +255,155 @@ TOOL_REACTION_SCHEMA = {
         }
     }
 }
+
+# Schema for the final autopost call after search tools: the reaction to the
+# results and the tweet in one response (thinking comes first so it is
+# generated before the text)
+REACTION_POST_SCHEMA: Final[dict[str, Any]] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "reaction_post",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "thinking": {
+                    "type": "string",
+                    "description": "Your thoughts about the tool results - what did you learn? how will this inform your post?"
+                },
+                "post_text": {
+                    "type": "string",
+                    "description": "The final tweet text (max 280 characters)"
+                }
+            },
+            "required": ["thinking", "post_text"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# ==================== Serialized Schemas ====================
+
+_STATIC_SCHEMAS = (
+    MENTION_SELECTOR_SCHEMA,
+    PLAN_SCHEMA,
+    POST_TEXT_SCHEMA,
+    MENTION_SELECTION_SCHEMA,
+    MENTION_PLAN_SCHEMA,
+    REPLY_TEXT_SCHEMA,
+    TOOL_REACTION_SCHEMA,
+    REACTION_POST_SCHEMA
+)
+
+# Compact JSON form of each static schema, keyed by json_schema name.
+# Computed once at import; these dicts never change at runtime.
+_SERIALIZED = {
+    schema["json_schema"]["name"]: json.dumps(schema, separators=(",", ":"))
+    for schema in _STATIC_SCHEMAS
+}
+
+
+def get_schema_json(name: str) -> str | None:
+    """
+    Get the cached JSON string for a static schema.
+
+    Args:
+        name: Schema name (json_schema.name, e.g. "agent_plan").
+
+    Returns:
+        Serialized schema, or None if no static schema has that name.
+    """
+    return _SERIALIZED.get(name)
+
+
+# ==================== Response Models ====================
+#
+# Typed mirrors of the static schemas. The dict schemas above are what we
+# send to the LLM; these parse + validate the returned JSON in one pass
+# (pydantic-core) instead of json.loads followed by a separate check.
+
+
+class _ResponseModel(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+
+class MentionSelectorResponse(_ResponseModel):
+    selected_tweet_id: str
+    text: str
+    include_picture: bool
+    reasoning: str
+
+
+class PlanStepParams(_ResponseModel):
+    query: str | None = None
+    prompt: str | None = None
+    username: str | None = None
+
+
+class PlanStep(_ResponseModel):
+    tool: str
+    params: PlanStepParams
+
+
+class AgentPlanResponse(_ResponseModel):
+    reasoning: str
+    plan: list[PlanStep]
+
+
+class AutopostPlanResponse(AgentPlanResponse):
+    # Filled only when no tools are needed; tolerated if the model omits it
+    post_text: str = ""
+
+
+class PostTextResponse(_ResponseModel):
+    post_text: str
+
+
+class SelectedMention(_ResponseModel):
+    tweet_id: str
+    priority: int
+    reasoning: str
+    suggested_approach: str
+
+
+class MentionSelectionResponse(_ResponseModel):
+    selected_mentions: list[SelectedMention]
+
+
+class ReplyTextResponse(_ResponseModel):
+    reply_text: str
+
+
+class ToolReactionResponse(_ResponseModel):
+    thinking: str
+
+
+class ReactionPostResponse(_ResponseModel):
+    thinking: str
+    post_text: str
+
+
+# json_schema name -> response model
+_RESPONSE_MODELS: dict[str, type[BaseModel]] = {
+    "mention_selector": MentionSelectorResponse,
+    "agent_plan": AutopostPlanResponse,
+    "post_text": PostTextResponse,
+    "mention_selection": MentionSelectionResponse,
+    "mention_plan": AgentPlanResponse,
+    "reply_text": ReplyTextResponse,
+    "tool_reaction": ToolReactionResponse,
+    "reaction_post": ReactionPostResponse
+}
+
+
+def get_response_model(name: str) -> type[BaseModel] | None:
+    """
+    Get the response model for a static schema.
+
+    Args:
+        name: Schema name (json_schema.name, e.g. "agent_plan").
+
+    Returns:
+        Pydantic model class, or None if no static schema has that name.
+    """
+    return _RESPONSE_MODELS.get(name)
@@ -4,6 +4,8 @@ Application settings using Pydantic Settings.
 Loads configuration from environment variables and .env file.
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +21,9 @@ class Settings(BaseSettings):
     # OpenRouter API (used for both LLM and image generation)
     openrouter_api_key: str
 
+    # Replaces the default text model in config/models.py when set
+    llm_model_override: str | None = None
+
     # Twitter API credentials
     twitter_api_key: str
     twitter_api_secret: str
@@ -42,5 +47,11 @@ class Settings(BaseSettings):
     allow_mentions: bool = True
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the cached settings instance."""
+    return Settings()
+
+
+# Global settings instance (kept for existing imports; prefer get_settings())
+settings = get_settings()
@@ -5,18 +5,25 @@ FastAPI application with APScheduler for scheduled posts.
 Version 1.3.2 - Improved Logging + Error Handling.
 """
 
+import base64
+import hashlib
+import hmac
 import logging
+import time
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from config.settings import settings
 from services.database import Database
+from services.http import close_http_client, get_http_client
 from services.autopost import AutoPostService
 from services.mentions import MentionHandler
 from services.tier_manager import TierManager
 from services.unified_agent import UnifiedAgent
+from utils.dedupe import tweet_history
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +32,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Consumer secret as bytes, encoded once at startup (Twitter secrets are ASCII)
+_TWITTER_SECRET_BYTES = settings.twitter_api_secret.encode("ascii")
+
+# CRC signing key is fixed for the process: key setup happens once, requests copy it
+_CRC_HMAC_TEMPLATE = hmac.new(_TWITTER_SECRET_BYTES, digestmod=hashlib.sha256)
+
+
+def _twitter_signature(payload: bytes) -> str:
+    """
+    Sign a payload the way Twitter does for CRC responses.
+
+    Args:
+        payload: Raw bytes to sign (the CRC token).
+
+    Returns:
+        "sha256=<base64 HMAC-SHA256>" using the app's consumer secret.
+    """
+    signature_hmac = _CRC_HMAC_TEMPLATE.copy()
+    signature_hmac.update(payload)
+    return "sha256=" + base64.b64encode(signature_hmac.digest()).decode()
+
+
+# Random offset added to each interval tick so jobs don't hit external APIs in lockstep
+SCHEDULER_JITTER_SECONDS = 30
+
+# Recent tweets loaded into the repeat filter at startup
+TWEET_HISTORY_SEED_LIMIT = 200
+
+# Reuse a DB ping result for this long so frequent health probes cost one query per window
+HEALTH_PING_TTL_SECONDS = 1.5
+_health_cache = {"checked_at": 0.0, "db_ok": False}
+
 # Global instances
 db = Database()
 scheduler = AsyncIOScheduler()
@@ -46,6 +85,16 @@ async def lifespan(app: FastAPI):
     await db.connect()
     logger.info("Database connected")
 
+    # Seed the repeat filter with what the bot actually posted, so it
+    # still rejects near-copies after a restart
+    posted_texts = await db.get_posted_texts(limit=TWEET_HISTORY_SEED_LIMIT)
+    for text in posted_texts:
+        tweet_history.add(text)
+    logger.info(f"Tweet history seeded with {len(posted_texts)} recent tweets")
+
+    # Shared pooled HTTP client for LLM / tool API calls
+    get_http_client()
+
     # Initialize tier manager - detect API tier and limits (with db for fallback)
     tier_manager = TierManager(db)
     await tier_manager.initialize()
@@ -78,7 +127,8 @@ async def lifespan(app: FastAPI):
             unified_agent.run,
             "interval",
             minutes=settings.agent_interval_minutes,
-            id="unified_agent"
+            id="unified_agent",
+            jitter=SCHEDULER_JITTER_SECONDS
         )
         logger.info(f"Scheduled unified agent every {settings.agent_interval_minutes} minutes")
 
@@ -93,7 +143,8 @@ async def lifespan(app: FastAPI):
             autopost_service.run,
             "interval",
             minutes=settings.post_interval_minutes,
-            id="autopost"
+            id="autopost",
+            jitter=SCHEDULER_JITTER_SECONDS
         )
         logger.info(f"Scheduled autopost every {settings.post_interval_minutes} minutes")
 
@@ -105,6 +156,7 @@ async def lifespan(app: FastAPI):
                 "interval",
                 minutes=settings.mentions_interval_minutes,
                 id="mentions",
+                jitter=SCHEDULER_JITTER_SECONDS,
                 kwargs={"dry_run": False}
             )
             logger.info(f"Scheduled mentions every {settings.mentions_interval_minutes} minutes")
@@ -116,7 +168,8 @@ async def lifespan(app: FastAPI):
         tier_manager.maybe_refresh_tier,
         "interval",
         hours=1,
-        id="tier_refresh"
+        id="tier_refresh",
+        jitter=SCHEDULER_JITTER_SECONDS
     )
     scheduler.start()
     logger.info("Scheduler started")
@@ -126,6 +179,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     scheduler.shutdown(wait=False)
+    await close_http_client()
     await db.close()
     logger.info("Application shutdown complete")
 
@@ -134,14 +188,19 @@ app = FastAPI(
     title="Twitter Agent Bot",
     description="Agent-based auto-posting Twitter bot with mention handling",
     version="1.3.2",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint with detailed status."""
-    db_ok = await db.ping()
+    now = time.monotonic()
+    if now - _health_cache["checked_at"] > HEALTH_PING_TTL_SECONDS:
+        _health_cache["db_ok"] = await db.ping()
+        _health_cache["checked_at"] = now
+    db_ok = _health_cache["db_ok"]
     return {
         "status": "healthy" if db_ok else "degraded",
         "database": "connected" if db_ok else "disconnected",
@@ -154,14 +213,8 @@ async def health_check():
 @app.get("/metrics")
 async def metrics():
     """Get bot metrics and statistics."""
-    return {
-        "posts_total": await db.count_posts(),
-        "posts_today": await db.count_posts_today(),
-        "mentions_total": await db.count_mentions(),
-        "mentions_today": await db.count_mentions_today(),
-        "last_post_at": await db.get_last_post_time(),
-        "last_mention_at": await db.get_last_mention_time()
-    }
+    # One round-trip for all counters and timestamps
+    return await db.get_metrics_snapshot()
 
 
 @app.get("/callback")
@@ -206,22 +259,10 @@ async def handle_mentions_webhook(request: Request):
 @app.get("/webhook/mentions")
 async def verify_webhook(crc_token: str = None):
     """Handle Twitter CRC challenge for webhook verification."""
-    import hmac
-    import hashlib
-    import base64
-
     if not crc_token:
         raise HTTPException(status_code=400, detail="Missing crc_token")
 
-    sha256_hash = hmac.new(
-        settings.twitter_api_secret.encode(),
-        msg=crc_token.encode(),
-        digestmod=hashlib.sha256
-    ).digest()
-
-    response_token = base64.b64encode(sha256_hash).decode()
-
-    return {"response_token": f"sha256={response_token}"}
+    return {"response_token": _twitter_signature(crc_token.encode())}
 
 
 @app.post("/trigger-post")
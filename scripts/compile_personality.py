@@ -0,0 +1,52 @@
+"""
+Generate config/personality/_compiled.py.
+
+Writes SYSTEM_PROMPT as a single string literal so process start doesn't
+need to import and join the personality parts. The runtime falls back to
+assembling from source when this file is stale; --check (for CI) exits
+non-zero in that case.
+
+Usage:
+    python scripts/compile_personality.py
+    python scripts/compile_personality.py --check
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from config.personality import assemble_system_prompt, source_digest  # noqa: E402
+
+OUTPUT_PATH = ROOT / "config" / "personality" / "_compiled.py"
+
+TEMPLATE = '''"""
+Precompiled SYSTEM_PROMPT.
+
+GENERATED by scripts/compile_personality.py - do not edit by hand.
+"""
+
+SOURCE_DIGEST = {digest!r}
+
+SYSTEM_PROMPT = {prompt!r}
+'''
+
+
+def main() -> None:
+    content = TEMPLATE.format(digest=source_digest(), prompt=assemble_system_prompt())
+
+    if "--check" in sys.argv[1:]:
+        current = OUTPUT_PATH.read_text(encoding="utf-8") if OUTPUT_PATH.exists() else ""
+        if current != content:
+            print(f"{OUTPUT_PATH.relative_to(ROOT)} is stale; run scripts/compile_personality.py")
+            sys.exit(1)
+        print(f"{OUTPUT_PATH.relative_to(ROOT)} is up to date")
+        return
+
+    OUTPUT_PATH.write_text(content, encoding="utf-8")
+    print(f"Wrote {OUTPUT_PATH.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
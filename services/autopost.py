@@ -7,28 +7,47 @@ and generates the final post text.
 All in one continuous conversation (user-assistant-user-assistant...).
 """
 
-import json
+import asyncio
 import logging
 import time
 import random
 import re
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from services.database import Database
 from services.llm import LLMClient
-from services.twitter import TwitterClient
-from tools.registry import TOOLS, get_tools_description
+from services.twitter import get_twitter_client
+from tools.registry import REACTION_TOOLS, TOOLS, get_tools_description
 from config.personality import SYSTEM_PROMPT
 from config.prompts.agent_autopost import AUTOPOST_AGENT_PROMPT
-from config.schemas import PLAN_SCHEMA, POST_TEXT_SCHEMA, TOOL_REACTION_SCHEMA
+from config.schemas import PLAN_SCHEMA, POST_TEXT_SCHEMA, REACTION_POST_SCHEMA
+from utils.backoff import backoff_delay
+from utils.dedupe import simhash, tweet_history
+from utils.tasks import discard_task
 
 logger = logging.getLogger(__name__)
 
+# Whitespace runs collapsed by sanitize_post_text
+_WS_RE = re.compile(r"\s+")
+# Lines starting with this (case-insensitive) are image placeholders, not tweet text
+_IMAGE_PREFIX = "[image"
+
+# Upper bound on a single tweet post attempt, in seconds
+TWITTER_POST_TIMEOUT = 15
+
+# Tweet length limit enforced by sanitize_post_text
+MAX_TWEET_CHARS = 280
+# Generation cap for tweet-only LLM calls: a 280-char tweet plus its JSON wrapper
+POST_TEXT_MAX_TOKENS = 256
+
 
 # -------------------------------------------------------------------
 # FALLBACK TWEETS (UNCHANGED — EXACTLY AS YOU PROVIDED)
 # -------------------------------------------------------------------
-FALLBACK_TWEETS = [
+FALLBACK_TWEETS = (
     "Keep going, little one. Even in the darkest storms, you're never alone. The moonlight will guide your paws and the whispers of the night will keep you company until morning comes. 🌙🐾",
     "A quiet guardian watches over you, even in the rain. Each drop is a soft song, and the shadows dance to remind you that you are never truly by yourself. 🌧️🐱💜",
     "Stay strong — every paw print leaves a mark in the heart. Every small step you take echoes in the world, and even when no one sees, love and warmth follow you. 🐾❤️✨",
@@ -36,34 +55,78 @@ FALLBACK_TWEETS = [
     "Soft paws, warm heart, never alone. The night hums with secret melodies just for you, teaching that even in quiet moments, love is everywhere. 🌙🐾💜",
     "Even small ones shine bright. Don't be afraid of the storm. Every shadow has its moon, every night its guardian — you are seen and cherished. ✨🐾🌌",
     "Silent support is the loudest love. The world whispers in soft echoes and gentle winds, reminding you that every small heartbeat is never without company. 🐾💛🌙"
-]
+)
+
+# Post-ready fallback pool: stripped and capped at tweet length once at import
+_FALLBACK_POOL = tuple(tweet.strip()[:280] for tweet in FALLBACK_TWEETS)
+# SimHash of each pool entry, so picking an unused fallback needs no hashing at run time
+_FALLBACK_FINGERPRINTS = tuple(simhash(tweet) for tweet in _FALLBACK_POOL)
+
+# Dedicated generator for fallback picks (non-cryptographic; independent of the global random state)
+_RNG = random.Random()
+
 
+def pick_fallback_tweet() -> str:
+    """Pick a fallback tweet, preferring ones not already posted (per tweet_history)."""
+    unused = [
+        tweet for tweet, fingerprint in zip(_FALLBACK_POOL, _FALLBACK_FINGERPRINTS)
+        if not tweet_history.is_duplicate_fingerprint(fingerprint)
+    ]
+    return _RNG.choice(unused or _FALLBACK_POOL)
 
-def get_agent_system_prompt() -> str:
-    tools_desc = get_tools_description()
-    return AUTOPOST_AGENT_PROMPT.format(tools_desc=tools_desc)
+
+# Opening user turn: identical every run, so it stays inside the cached prompt prefix
+AUTOPOST_TASK_MESSAGE = (
+    "Create a Twitter post. Your previous posts are listed in the next message — don't repeat them.\n\n"
+    "Create your plan. What tools do you need (if any)?"
+)
+
+
+@lru_cache(maxsize=1)
+def _agent_system_prompt(tools_desc: str) -> tuple[str, ...]:
+    return (AUTOPOST_AGENT_PROMPT, tools_desc)
+
+
+@lru_cache(maxsize=1)
+def _full_system_prompt(tools_desc: str) -> tuple[str, ...]:
+    return (SYSTEM_PROMPT, *_agent_system_prompt(tools_desc))
+
+
+def get_agent_system_prompt() -> tuple[str, ...]:
+    """
+    Agent prompt segments: static instructions, then the semi-static tools description.
+
+    Kept as separate segments so each can be cached independently by the provider.
+    Memoized on the (itself cached) tools description, so refresh_tools() still
+    takes effect and the same tuple is returned every cycle.
+    """
+    return _agent_system_prompt(get_tools_description())
+
+
+def get_full_system_prompt() -> tuple[str, ...]:
+    """Personality followed by the agent prompt segments, memoized like get_agent_system_prompt()."""
+    return _full_system_prompt(get_tools_description())
 
 
 def sanitize_post_text(text: str) -> str:
     """
     Final hard sanitizer to prevent mixed tweets, image leaks, or junk output.
+
+    The result is capped at MAX_TWEET_CHARS.
     """
     if not text:
         return ""
 
-    lines = []
-    for line in text.splitlines():
-        s = line.strip()
-        if not s:
-            continue
-        if s.lower().startswith("[image"):
-            continue
-        if s.startswith("{") or s.endswith("}"):
-            continue
-        lines.append(s)
-
-    text = " ".join(lines)
-    text = re.sub(r"\s+", " ", text).strip()
+    lines = [
+        s for s in (line.strip() for line in text.splitlines())
+        if s
+        and not s.lower().startswith(_IMAGE_PREFIX)
+        and not (s.startswith("{") or s.endswith("}"))
+    ]
+
+    text = _WS_RE.sub(" ", " ".join(lines)).strip()
+    if len(text) > MAX_TWEET_CHARS:
+        text = text[:MAX_TWEET_CHARS].rstrip()
     return text
 
 
@@ -72,41 +135,76 @@ class AutoPostService:
 
     def __init__(self, db: Database, tier_manager=None):
         self.db = db
-        self.llm = LLMClient()
-        self.twitter = TwitterClient()
+        self.llm = LLMClient(cache_ttl=3600)
+        self.twitter = get_twitter_client()
         self.tier_manager = tier_manager
+        # Strong refs to fire-and-forget tasks so they aren't GC'd mid-flight
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def _spawn(self, coro, description: str) -> None:
+        """Run a coroutine in the background, logging (not raising) its failure."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+
+        def _done(t: asyncio.Task) -> None:
+            self._background_tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.error("[AUTOPOST] Background %s failed: %s", description, t.exception())
+
+        task.add_done_callback(_done)
+
+    async def _run_tool(self, tool_name: str, params: dict) -> str:
+        """Run a non-image tool with service context, returning its result or an error string."""
+        try:
+            return await TOOLS[tool_name](
+                twitter=self.twitter,
+                db=self.db,
+                tier_manager=self.tier_manager,
+                **params
+            )
+        except Exception as e:
+            logger.error("[AUTOPOST] Tool %s failed: %s", tool_name, e)
+            return f"Error executing {tool_name}: {e}"
 
     def _sanitize_plan(self, plan: list[dict]) -> list[dict]:
+        """
+        Keep up to 3 known tool steps, at most one generate_image, which is moved last.
+
+        Single pass: the image step is held aside and appended at the end.
+        """
         if not isinstance(plan, list):
             return []
 
-        sanitized = []
-        has_image = False
+        steps = []
+        image_step = None
+
+        # Loop-invariant lookups bound to locals
+        tools = TOOLS
+        append = steps.append
 
         for step in plan:
             if not isinstance(step, dict):
                 continue
 
             tool_name = step.get("tool")
-            params = step.get("params", {})
-
-            if tool_name not in TOOLS:
+            if tool_name not in tools:
+                logger.warning("[AUTOPOST] Dropping unknown tool from plan: %s", tool_name)
                 continue
 
+            step_dict = {"tool": tool_name, "params": step.get("params", {})}
             if tool_name == "generate_image":
-                if has_image:
+                if image_step is not None:
                     continue
-                has_image = True
-
-            sanitized.append({"tool": tool_name, "params": params})
+                image_step = step_dict
+            else:
+                append(step_dict)
 
-            if len(sanitized) >= 3:
+            if len(steps) + (image_step is not None) >= 3:
                 break
 
-        image_steps = [s for s in sanitized if s["tool"] == "generate_image"]
-        non_image_steps = [s for s in sanitized if s["tool"] != "generate_image"]
-
-        return non_image_steps + image_steps[:1]
+        if image_step is not None:
+            steps.append(image_step)
+        return steps
 
     async def run(self) -> dict[str, Any]:
         start_time = time.time()
@@ -125,84 +223,158 @@ class AutoPostService:
 
             previous_posts = await self.db.get_recent_posts_formatted(limit=50)
 
-            system_prompt = SYSTEM_PROMPT + get_agent_system_prompt()
+            system_prompt = get_full_system_prompt()
+            # Static messages first so system + task form a byte-stable prefix
+            # for provider prompt caching; the per-run history goes last
             messages = [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"""Create a Twitter post. Here are your previous posts (don't repeat):
-
-{previous_posts}
-
-Now create your plan. What tools do you need (if any)?"""}
+                {"role": "user", "content": AUTOPOST_TASK_MESSAGE},
+                {"role": "user", "content": f"Your previous posts (don't repeat):\n\n{previous_posts}"}
             ]
 
-            plan_result_raw = await self.llm.chat(messages, PLAN_SCHEMA)
-
-            try:
-                plan_result = (
-                    plan_result_raw if isinstance(plan_result_raw, dict)
-                    else json.loads(plan_result_raw)
-                )
-            except Exception:
-                plan_result = {}
+            # chat() always returns a parsed dict (text fallbacks are wrapped),
+            # so the plan needs no second decode
+            plan_result = await self.llm.chat(messages, PLAN_SCHEMA)
 
             plan = self._sanitize_plan(plan_result.get("plan", []))
-            messages.append({"role": "assistant", "content": json.dumps(plan_result)})
+            messages.append({"role": "assistant", "content": orjson.dumps(plan_result).decode()})
 
             image_bytes = None
+            needs_reaction = False
 
-            for step in plan:
-                tool = step["tool"]
-                params = step["params"]
+            # The image prompt comes from the plan, not from other tools' results,
+            # so generation starts right away and overlaps the info tools + reaction
+            image_step = plan[-1] if plan and plan[-1]["tool"] == "generate_image" else None
+            image_task = (
+                asyncio.create_task(TOOLS["generate_image"](image_step["params"].get("prompt", "")))
+                if image_step else None
+            )
 
-                if tool == "generate_image":
+            try:
+                # Non-image steps don't depend on each other: run them concurrently
+                # and react to all results in one LLM call
+                # _sanitize_plan puts the image step last, so no rescan of the plan is needed
+                info_steps = plan[:-1] if image_step else plan
+
+                if info_steps:
+                    results = await asyncio.gather(
+                        *(self._run_tool(step["tool"], step["params"]) for step in info_steps)
+                    )
+                    messages.append({"role": "user", "content": "\n\n".join(
+                        f"Tool result ({step['tool']}):\n{result}"
+                        for step, result in zip(info_steps, results)
+                    )})
+
+                    # Only search results need digesting; profile/history lookups are
+                    # absorbed directly by the final-text call
+                    needs_reaction = any(step["tool"] in REACTION_TOOLS for step in info_steps)
+
+                # No reaction call for the image: the result carries no information
+                # beyond "completed", so the model has nothing to think about before writing.
+                if image_task:
                     try:
-                        image_bytes = await TOOLS[tool](params.get("prompt", ""))
+                        image_bytes = await image_task
                         messages.append({"role": "user", "content": "Tool result (generate_image): completed"})
                     except Exception:
                         image_bytes = None
+            finally:
+                # Info tools trap their own errors, but cancellation of the run would
+                # otherwise leave image generation running unattended
+                discard_task(image_task)
 
-                reaction = await self.llm.chat(messages, TOOL_REACTION_SCHEMA)
-                messages.append({"role": "assistant", "content": reaction.get("thinking", "")})
+            # Start the media upload now so it overlaps with the final text LLM call
+            upload_task = asyncio.create_task(self.twitter.upload_media(image_bytes)) if image_bytes else None
 
-            messages.append({"role": "user", "content": "Now write your final tweet text. Just the tweet."})
-            post_result_raw = await self.llm.chat(messages, POST_TEXT_SCHEMA)
-
-            post_text = ""
-            if isinstance(post_result_raw, dict):
-                post_text = post_result_raw.get("post_text", "")
-            else:
-                try:
-                    post_text = json.loads(post_result_raw).get("post_text", "")
-                except Exception:
-                    post_text = post_result_raw or ""
-
-            post_text = sanitize_post_text(post_text)
-
-            if not post_text or len(post_text) < 20:
-                post_text = random.choice(FALLBACK_TWEETS)
-
-            media_ids = None
-            if image_bytes:
-                try:
-                    media_id = await self.twitter.upload_media(image_bytes)
-                    media_ids = [media_id]
-                except Exception:
-                    image_bytes = None
+            try:
+                # No tools: the plan call already wrote the tweet, skip the extra round-trip
+                post_text = "" if plan else plan_result.get("post_text", "")
+
+                if not post_text:
+                    if needs_reaction:
+                        # Reaction to the search results and the tweet in one round-trip
+                        messages.append({
+                            "role": "user",
+                            "content": "Think about what the tool results tell you, then write your final tweet text."
+                        })
+                        post_result = await self.llm.chat(messages, REACTION_POST_SCHEMA)
+                    else:
+                        messages.append({"role": "user", "content": "Now write your final tweet text. Just the tweet."})
+                        post_result = await self.llm.chat(
+                            messages, POST_TEXT_SCHEMA, max_tokens=POST_TEXT_MAX_TOKENS
+                        )
+                    post_text = post_result.get("post_text", "")
+
+                post_text = sanitize_post_text(post_text)
+
+                if post_text and tweet_history.is_duplicate(post_text):
+                    logger.info("[AUTOPOST] Draft too similar to a previous tweet — retrying")
+                    messages.append({"role": "assistant", "content": post_text})
+                    messages.append({
+                        "role": "user",
+                        "content": "That's too close to a tweet you already made. Be more original. Just the tweet."
+                    })
+                    retry_result = await self.llm.chat(
+                        messages, POST_TEXT_SCHEMA, max_tokens=POST_TEXT_MAX_TOKENS
+                    )
+                    post_text = sanitize_post_text(retry_result.get("post_text", ""))
+
+                    if tweet_history.is_duplicate(post_text):
+                        post_text = ""
+
+                if not post_text or len(post_text) < 20:
+                    post_text = pick_fallback_tweet()
+
+                media_ids = None
+                if upload_task:
+                    try:
+                        media_id = await upload_task
+                        media_ids = [media_id]
+                    except Exception:
+                        image_bytes = None
+            finally:
+                # Don't leave the upload running if text generation raised
+                discard_task(upload_task)
 
             tweet_data = None
             for attempt in range(3):
                 try:
-                    tweet_data = await self.twitter.post(post_text, media_ids=media_ids)
+                    # Bounded so a hung connection can't eat the whole retry budget
+                    tweet_data = await asyncio.wait_for(
+                        self.twitter.post(post_text, media_ids=media_ids),
+                        timeout=TWITTER_POST_TIMEOUT
+                    )
                     break
+                except asyncio.TimeoutError:
+                    # wait_for can't cancel the tweepy worker thread, so the tweet may
+                    # still go out: retrying or falling back could post it twice
+                    logger.error(
+                        "[AUTOPOST] Twitter timed out after %ss, outcome unknown — not retrying",
+                        TWITTER_POST_TIMEOUT
+                    )
+                    tweet_history.add(post_text)
+                    return {
+                        "success": False,
+                        "error": "post_timeout_outcome_unknown",
+                        "text": post_text,
+                        "duration_seconds": round(time.time() - start_time, 1)
+                    }
                 except Exception as e:
-                    logger.error(f"[AUTOPOST] Twitter failure ({attempt + 1}/3): {e}")
-                    time.sleep(5)
+                    logger.error("[AUTOPOST] Twitter failure (%d/3): %s", attempt + 1, e)
 
-            if not tweet_data:
-                fallback = random.choice(FALLBACK_TWEETS)
-                tweet_data = await self.twitter.post(fallback)
+                if attempt < 2:
+                    await asyncio.sleep(backoff_delay(attempt, base=2.0))
 
-            await self.db.save_post(post_text, tweet_data["id"], image_bytes is not None)
+            if not tweet_data:
+                post_text = pick_fallback_tweet()
+                image_bytes = None
+                tweet_data = await self.twitter.post(post_text)
+
+            # The tweet is live; persisting it doesn't need to delay the result
+            self._spawn(
+                self.db.save_post(post_text, tweet_data["id"], image_bytes is not None),
+                "save_post"
+            )
+            tweet_history.add(post_text)
 
             return {
                 "success": True,
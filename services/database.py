@@ -13,6 +13,100 @@ from config.settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Pool sizing: the bot runs a few short queries per cycle, so a small pool suffices
+DB_POOL_MIN_SIZE = 2
+DB_POOL_MAX_SIZE = 10
+# asyncpg prepares every parameterized query once per connection and caches it
+# (statement_cache_size). Idle connections outlive the gap between scheduler
+# cycles so that cache survives, but are still recycled well before typical
+# server/proxy/NAT idle reapers would leave a dead socket in the pool
+DB_POOL_MAX_INACTIVE_LIFETIME = 1200.0
+
+# Schema setup, idempotent (IF NOT EXISTS / guarded DO blocks). Sent as one
+# multi-statement string so connect() costs a single round-trip.
+SCHEMA_SQL = """
+-- Posts table
+CREATE TABLE IF NOT EXISTS posts (
+    id SERIAL PRIMARY KEY,
+    text TEXT NOT NULL,
+    tweet_id VARCHAR(50),
+    include_picture BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Add include_picture column if it doesn't exist (for existing tables)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'posts' AND column_name = 'include_picture'
+    ) THEN
+        ALTER TABLE posts ADD COLUMN include_picture BOOLEAN DEFAULT FALSE;
+    END IF;
+END $$;
+
+-- Mentions table
+CREATE TABLE IF NOT EXISTS mentions (
+    id SERIAL PRIMARY KEY,
+    tweet_id VARCHAR(50) UNIQUE,
+    author_handle VARCHAR(50),
+    author_text TEXT,
+    our_reply TEXT,
+    action VARCHAR(20),
+    tools_used TEXT,
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Add tools_used column if it doesn't exist (for existing tables)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'mentions' AND column_name = 'tools_used'
+    ) THEN
+        ALTER TABLE mentions ADD COLUMN tools_used TEXT;
+    END IF;
+END $$;
+
+-- Bot state table (for storing last_mention_id, etc.)
+CREATE TABLE IF NOT EXISTS bot_state (
+    key VARCHAR(50) PRIMARY KEY,
+    value TEXT,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Actions table (unified agent - posts + replies)
+CREATE TABLE IF NOT EXISTS actions (
+    id SERIAL PRIMARY KEY,
+    action_type VARCHAR(20) NOT NULL,
+    text TEXT NOT NULL,
+    tweet_id VARCHAR(50),
+    include_picture BOOLEAN DEFAULT FALSE,
+    reply_to_tweet_id VARCHAR(50),
+    reply_to_author VARCHAR(50),
+    created_at TIMESTAMP DEFAULT NOW()
+);
+
+-- Create indexes for actions table
+CREATE INDEX IF NOT EXISTS idx_actions_created_at ON actions(created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_actions_type ON actions(action_type);
+
+-- Newest-first scans for the recent-context and last-activity queries
+CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts(created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mentions_created_at ON mentions(created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mentions_replied_created_at ON mentions(created_at DESC)
+WHERE our_reply IS NOT NULL;
+
+-- Case-insensitive per-user history lookups (LOWER(handle) = LOWER($1))
+CREATE INDEX IF NOT EXISTS idx_mentions_author_lower ON mentions (LOWER(author_handle));
+
+CREATE INDEX IF NOT EXISTS idx_actions_reply_author_lower ON actions (LOWER(reply_to_author))
+WHERE action_type = 'reply';
+"""
+
 
 class Database:
     """Async PostgreSQL database client using asyncpg."""
@@ -20,6 +114,12 @@ class Database:
     def __init__(self):
         """Initialize database client."""
         self.pool: asyncpg.Pool | None = None
+        # Formatted recent-posts context by (limit, max_chars); cleared on save_post
+        self._recent_posts_cache: dict[tuple[int, int], str] = {}
+        # Formatted recent-actions context by limit; cleared on save_action
+        self._recent_actions_cache: dict[int, str] = {}
+        # Formatted recent-mentions context by limit; cleared on save_mention/update_mention
+        self._recent_mentions_cache: dict[int, str] = {}
 
     async def connect(self) -> None:
         """
@@ -28,91 +128,16 @@ class Database:
         Establishes connection pool and initializes schema.
         """
         logger.info("Connecting to database...")
-        self.pool = await asyncpg.create_pool(settings.database_url)
-
-        # Create tables if they don't exist
+        self.pool = await asyncpg.create_pool(
+            settings.database_url,
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            max_inactive_connection_lifetime=DB_POOL_MAX_INACTIVE_LIFETIME
+        )
+
+        # Create tables and indexes if they don't exist
         async with self.pool.acquire() as conn:
-            # Posts table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS posts (
-                    id SERIAL PRIMARY KEY,
-                    text TEXT NOT NULL,
-                    tweet_id VARCHAR(50),
-                    include_picture BOOLEAN DEFAULT FALSE,
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Add include_picture column if it doesn't exist (for existing tables)
-            await conn.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name = 'posts' AND column_name = 'include_picture'
-                    ) THEN
-                        ALTER TABLE posts ADD COLUMN include_picture BOOLEAN DEFAULT FALSE;
-                    END IF;
-                END $$;
-            """)
-
-            # Mentions table
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS mentions (
-                    id SERIAL PRIMARY KEY,
-                    tweet_id VARCHAR(50) UNIQUE,
-                    author_handle VARCHAR(50),
-                    author_text TEXT,
-                    our_reply TEXT,
-                    action VARCHAR(20),
-                    tools_used TEXT,
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Add tools_used column if it doesn't exist (for existing tables)
-            await conn.execute("""
-                DO $$
-                BEGIN
-                    IF NOT EXISTS (
-                        SELECT 1 FROM information_schema.columns
-                        WHERE table_name = 'mentions' AND column_name = 'tools_used'
-                    ) THEN
-                        ALTER TABLE mentions ADD COLUMN tools_used TEXT;
-                    END IF;
-                END $$;
-            """)
-
-            # Bot state table (for storing last_mention_id, etc.)
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS bot_state (
-                    key VARCHAR(50) PRIMARY KEY,
-                    value TEXT,
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Actions table (unified agent - posts + replies)
-            await conn.execute("""
-                CREATE TABLE IF NOT EXISTS actions (
-                    id SERIAL PRIMARY KEY,
-                    action_type VARCHAR(20) NOT NULL,
-                    text TEXT NOT NULL,
-                    tweet_id VARCHAR(50),
-                    include_picture BOOLEAN DEFAULT FALSE,
-                    reply_to_tweet_id VARCHAR(50),
-                    reply_to_author VARCHAR(50),
-                    created_at TIMESTAMP DEFAULT NOW()
-                )
-            """)
-
-            # Create indexes for actions table
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_actions_created_at ON actions(created_at DESC)
-            """)
-            await conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_actions_type ON actions(action_type)
-            """)
+            await conn.execute(SCHEMA_SQL)
 
         logger.info("Database connected and tables created")
 
@@ -122,12 +147,18 @@ class Database:
             await self.pool.close()
             logger.info("Database connection closed")
 
-    async def get_recent_posts_formatted(self, limit: int = 50) -> str:
+    async def get_recent_posts_formatted(self, limit: int = 50, max_chars: int = 4000) -> str:
         """
         Get recent posts formatted for LLM context.
 
+        Only the newest whole posts that fit in max_chars are kept, so the
+        prompt size stays bounded however long the posts are. The result is
+        cached until the next save_post, which is the only writer of the
+        posts table, so steady-state cycles skip the query.
+
         Args:
             limit: Maximum number of posts to retrieve.
+            max_chars: Character budget for the formatted result.
 
         Returns:
             Formatted string with numbered posts.
@@ -135,27 +166,80 @@ class Database:
         if not self.pool:
             raise RuntimeError("Database not connected")
 
+        cache_key = (limit, max_chars)
+        cached = self._recent_posts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         async with self.pool.acquire() as conn:
             row = await conn.fetchrow("""
-                WITH numbered AS (
+                WITH last_n AS (
+                    SELECT text, include_picture, created_at
+                    FROM posts
+                    ORDER BY created_at DESC
+                    LIMIT $1
+                ),
+                numbered AS (
                     SELECT
                         text,
                         include_picture,
                         row_number() OVER (ORDER BY created_at ASC) AS rn
-                    FROM posts
+                    FROM last_n
+                ),
+                lines AS (
+                    SELECT
+                        rn,
+                        'post ' || rn || ' (pic: ' || COALESCE(include_picture, false) || '): ' || COALESCE(text, '') AS line
+                    FROM numbered
+                ),
+                budgeted AS (
+                    SELECT
+                        rn,
+                        line,
+                        sum(length(line) + 1) OVER (ORDER BY rn DESC) AS running_chars
+                    FROM lines
                 )
                 SELECT
                     COALESCE(
-                        string_agg(
-                            'post ' || rn || ' (pic: ' || include_picture || '): ' || text,
-                            E'\n' ORDER BY rn
-                        ),
+                        string_agg(line, E'\n' ORDER BY rn),
                         'No previous posts'
                     ) AS texts
-                FROM numbered
-                WHERE rn > (SELECT COUNT(*) FROM posts) - $1
-            """, limit)
-            return row["texts"]
+                FROM budgeted
+                WHERE running_chars <= $2
+            """, limit, max_chars)
+
+        self._recent_posts_cache[cache_key] = row["texts"]
+        return row["texts"]
+
+    async def get_posted_texts(self, limit: int = 200) -> list[str]:
+        """
+        Get the text of the bot's most recent tweets, newest first.
+
+        Covers both legacy autoposts (posts table) and unified agent posts
+        (actions with action_type 'post').
+
+        Args:
+            limit: Maximum number of texts to retrieve.
+
+        Returns:
+            List of tweet texts.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected")
+
+        rows = await self.pool.fetch(
+            """
+            SELECT text FROM (
+                SELECT text, created_at FROM posts
+                UNION ALL
+                SELECT text, created_at FROM actions WHERE action_type = 'post'
+            ) posted
+            ORDER BY created_at DESC
+            LIMIT $1
+            """,
+            limit
+        )
+        return [row["text"] for row in rows]
 
     async def get_recent_posts(self, limit: int = 10) -> list[dict[str, Any]]:
         """
@@ -197,6 +281,7 @@ class Database:
                 "INSERT INTO posts (text, tweet_id, include_picture) VALUES ($1, $2, $3) RETURNING id",
                 text, tweet_id, include_picture
             )
+            self._recent_posts_cache.clear()
             logger.info(f"Saved post {row['id']} with tweet_id {tweet_id}, include_picture={include_picture}")
             return row["id"]
 
@@ -240,9 +325,37 @@ class Database:
                 action,
                 tools_used
             )
+            self._recent_mentions_cache.clear()
             logger.info(f"Saved mention {row['id']} with action '{action}', tools: {tools_used}")
             return row["id"]
 
+    async def save_pending_mentions(self, mentions: list[tuple[str, str, str]]) -> None:
+        """
+        Save newly seen mentions as 'pending' in one batch.
+
+        Mentions already in the table are left untouched.
+
+        Args:
+            mentions: (tweet_id, author_handle, author_text) tuples.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected")
+
+        if not mentions:
+            return
+
+        # executemany pipelines the inserts over a single connection
+        await self.pool.executemany(
+            """
+            INSERT INTO mentions (tweet_id, author_handle, author_text, our_reply, action)
+            VALUES ($1, $2, $3, NULL, 'pending')
+            ON CONFLICT (tweet_id) DO NOTHING
+            """,
+            mentions
+        )
+        self._recent_mentions_cache.clear()
+        logger.info(f"Saved {len(mentions)} pending mentions")
+
     async def get_user_mention_history(self, author_handle: str, limit: int = 5) -> str:
         """
         Get recent mention history with a specific user.
@@ -257,32 +370,34 @@ class Database:
         if not self.pool:
             raise RuntimeError("Database not connected")
 
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
+        # Formatted in SQL, oldest first: one text value instead of a row per mention
+        history = await self.pool.fetchval(
+            """
+            SELECT string_agg(
+                '@' || $1::text || ': ' || COALESCE(author_text, '') || E'\n'
+                    || 'You replied: ' || COALESCE(our_reply, ''),
+                E'\n' ORDER BY created_at ASC
+            )
+            FROM (
                 SELECT author_text, our_reply, created_at
                 FROM mentions
                 WHERE LOWER(author_handle) = LOWER($1) AND our_reply IS NOT NULL
                 ORDER BY created_at DESC
                 LIMIT $2
-                """,
-                author_handle, limit
-            )
-
-            if not rows:
-                return "No previous conversations with this user."
+            ) recent
+            """,
+            author_handle, limit
+        )
 
-            history = []
-            for row in reversed(rows):  # Oldest first
-                history.append(f"@{author_handle}: {row['author_text']}")
-                history.append(f"You replied: {row['our_reply']}")
-
-            return "\n".join(history)
+        return history or "No previous conversations with this user."
 
     async def get_recent_mentions_formatted(self, limit: int = 15) -> str:
         """
         Get recent mentions formatted for LLM context.
 
+        Cached until the next save_mention or update_mention, the only
+        writers of the mentions table.
+
         Args:
             limit: Maximum number of mentions to retrieve.
 
@@ -292,27 +407,37 @@ class Database:
         if not self.pool:
             raise RuntimeError("Database not connected")
 
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT author_handle, author_text, our_reply, action
+        cached = self._recent_mentions_cache.get(limit)
+        if cached is not None:
+            return cached
+
+        # Formatted in SQL, numbered oldest first
+        history = await self.pool.fetchval(
+            """
+            WITH recent AS (
+                SELECT author_handle, author_text, our_reply, created_at
                 FROM mentions
                 WHERE our_reply IS NOT NULL
                 ORDER BY created_at DESC
                 LIMIT $1
-                """,
-                limit
+            ),
+            numbered AS (
+                SELECT *, row_number() OVER (ORDER BY created_at ASC) AS rn
+                FROM recent
             )
+            SELECT string_agg(
+                rn || '. @' || COALESCE(author_handle, '') || ': ' || COALESCE(author_text, '')
+                    || E'\n   Your reply: ' || COALESCE(our_reply, ''),
+                E'\n' ORDER BY rn
+            )
+            FROM numbered
+            """,
+            limit
+        )
 
-            if not rows:
-                return "No previous mention replies."
-
-            history = []
-            for i, row in enumerate(reversed(rows), 1):  # Oldest first
-                history.append(f"{i}. @{row['author_handle']}: {row['author_text']}")
-                history.append(f"   Your reply: {row['our_reply']}")
-
-            return "\n".join(history)
+        formatted = history or "No previous mention replies."
+        self._recent_mentions_cache[limit] = formatted
+        return formatted
 
     async def get_state(self, key: str) -> str | None:
         """
@@ -370,18 +495,40 @@ class Database:
         if not self.pool:
             raise RuntimeError("Database not connected")
 
-        async with self.pool.acquire() as conn:
-            if include_pending:
-                row = await conn.fetchrow(
-                    "SELECT 1 FROM mentions WHERE tweet_id = $1",
-                    tweet_id
-                )
-            else:
-                row = await conn.fetchrow(
-                    "SELECT 1 FROM mentions WHERE tweet_id = $1 AND action != 'pending'",
-                    tweet_id
-                )
-            return row is not None
+        # EXISTS stops at the first match (tweet_id is UNIQUE, so an index probe)
+        if include_pending:
+            return await self.pool.fetchval(
+                "SELECT EXISTS(SELECT 1 FROM mentions WHERE tweet_id = $1)",
+                tweet_id
+            )
+        return await self.pool.fetchval(
+            "SELECT EXISTS(SELECT 1 FROM mentions WHERE tweet_id = $1 AND action <> 'pending')",
+            tweet_id
+        )
+
+    async def get_processed_mention_ids(self, tweet_ids: list[str]) -> set[str]:
+        """
+        Get which of the given mentions have already been processed.
+
+        Batch form of mention_exists(tweet_id) for many IDs in one query.
+
+        Args:
+            tweet_ids: Tweet IDs to check.
+
+        Returns:
+            Subset of tweet_ids that exist with a non-pending action.
+        """
+        if not self.pool:
+            raise RuntimeError("Database not connected")
+
+        if not tweet_ids:
+            return set()
+
+        rows = await self.pool.fetch(
+            "SELECT tweet_id FROM mentions WHERE tweet_id = ANY($1::varchar[]) AND action <> 'pending'",
+            tweet_ids
+        )
+        return {row["tweet_id"] for row in rows}
 
     async def get_pending_mention(self, tweet_id: str) -> dict | None:
         """
@@ -430,6 +577,7 @@ class Database:
                 """,
                 tweet_id, our_reply, action, tools_used
             )
+            self._recent_mentions_cache.clear()
             logger.info(f"Updated mention {tweet_id} with action '{action}', tools: {tools_used}")
 
     # ==================== Metrics Methods ====================
@@ -445,8 +593,7 @@ class Database:
             return False
 
         try:
-            async with self.pool.acquire() as conn:
-                await conn.fetchval("SELECT 1")
+            await self.pool.fetchval("SELECT 1")
             return True
         except Exception as e:
             logger.error(f"Database ping failed: {e}")
@@ -457,62 +604,96 @@ class Database:
         if not self.pool:
             return 0
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval("SELECT COUNT(*) FROM posts")
+        return await self.pool.fetchval("SELECT COUNT(*) FROM posts")
 
     async def count_posts_today(self) -> int:
         """Get number of posts created today."""
         if not self.pool:
             return 0
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval(
-                "SELECT COUNT(*) FROM posts WHERE created_at >= CURRENT_DATE"
-            )
+        return await self.pool.fetchval(
+            "SELECT COUNT(*) FROM posts WHERE created_at >= CURRENT_DATE"
+        )
 
     async def count_mentions(self) -> int:
         """Get total number of processed mentions."""
         if not self.pool:
             return 0
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval("SELECT COUNT(*) FROM mentions")
+        return await self.pool.fetchval("SELECT COUNT(*) FROM mentions")
 
     async def count_mentions_today(self) -> int:
         """Get number of mentions processed today."""
         if not self.pool:
             return 0
 
-        async with self.pool.acquire() as conn:
-            return await conn.fetchval(
-                "SELECT COUNT(*) FROM mentions WHERE created_at >= CURRENT_DATE"
-            )
+        return await self.pool.fetchval(
+            "SELECT COUNT(*) FROM mentions WHERE created_at >= CURRENT_DATE"
+        )
 
     async def get_last_post_time(self) -> str | None:
         """Get timestamp of the last post."""
         if not self.pool:
             return None
 
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT created_at FROM posts ORDER BY created_at DESC LIMIT 1"
-            )
-            if row:
-                return row["created_at"].isoformat()
-            return None
+        row = await self.pool.fetchrow(
+            "SELECT created_at FROM posts ORDER BY created_at DESC LIMIT 1"
+        )
+        if row:
+            return row["created_at"].isoformat()
+        return None
 
     async def get_last_mention_time(self) -> str | None:
         """Get timestamp of the last processed mention."""
         if not self.pool:
             return None
 
-        async with self.pool.acquire() as conn:
-            row = await conn.fetchrow(
-                "SELECT created_at FROM mentions ORDER BY created_at DESC LIMIT 1"
-            )
-            if row:
-                return row["created_at"].isoformat()
-            return None
+        row = await self.pool.fetchrow(
+            "SELECT created_at FROM mentions ORDER BY created_at DESC LIMIT 1"
+        )
+        if row:
+            return row["created_at"].isoformat()
+        return None
+
+    async def get_metrics_snapshot(self) -> dict[str, Any]:
+        """
+        Get all dashboard metrics in a single round-trip.
+
+        Same values as count_posts, count_posts_today, count_mentions,
+        count_mentions_today, get_last_post_time and get_last_mention_time.
+
+        Returns:
+            Dict with posts_total, posts_today, mentions_total, mentions_today,
+            last_post_at and last_mention_at.
+        """
+        if not self.pool:
+            return {
+                "posts_total": 0,
+                "posts_today": 0,
+                "mentions_total": 0,
+                "mentions_today": 0,
+                "last_post_at": None,
+                "last_mention_at": None
+            }
+
+        row = await self.pool.fetchrow("""
+            SELECT
+                (SELECT COUNT(*) FROM posts) AS posts_total,
+                (SELECT COUNT(*) FROM posts WHERE created_at >= CURRENT_DATE) AS posts_today,
+                (SELECT COUNT(*) FROM mentions) AS mentions_total,
+                (SELECT COUNT(*) FROM mentions WHERE created_at >= CURRENT_DATE) AS mentions_today,
+                (SELECT MAX(created_at) FROM posts) AS last_post_at,
+                (SELECT MAX(created_at) FROM mentions) AS last_mention_at
+        """)
+
+        return {
+            "posts_total": row["posts_total"],
+            "posts_today": row["posts_today"],
+            "mentions_total": row["mentions_total"],
+            "mentions_today": row["mentions_today"],
+            "last_post_at": row["last_post_at"].isoformat() if row["last_post_at"] else None,
+            "last_mention_at": row["last_mention_at"].isoformat() if row["last_mention_at"] else None
+        }
 
     # ==================== Unified Agent Methods ====================
 
@@ -520,6 +701,8 @@ class Database:
         """
         Get recent actions (posts + replies) formatted for LLM context.
 
+        Cached until the next save_action, the only writer of the actions table.
+
         Args:
             limit: Maximum number of actions to retrieve.
 
@@ -529,33 +712,42 @@ class Database:
         if not self.pool:
             raise RuntimeError("Database not connected")
 
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
+        cached = self._recent_actions_cache.get(limit)
+        if cached is not None:
+            return cached
+
+        # Formatted in SQL, numbered oldest first; unknown action types keep
+        # their number but produce no line (string_agg skips NULLs)
+        history = await self.pool.fetchval(
+            """
+            WITH recent AS (
                 SELECT action_type, text, include_picture, reply_to_author, created_at
                 FROM actions
                 ORDER BY created_at DESC
                 LIMIT $1
-                """,
-                limit
+            ),
+            numbered AS (
+                SELECT *, row_number() OVER (ORDER BY created_at ASC) AS rn
+                FROM recent
             )
+            SELECT string_agg(
+                CASE action_type
+                    WHEN 'post' THEN
+                        rn || '. POST (pic: ' || COALESCE(include_picture, false) || '): ' || COALESCE(text, '')
+                    WHEN 'reply' THEN
+                        rn || '. REPLY to @' || COALESCE(reply_to_author, 'unknown')
+                            || ' (pic: ' || COALESCE(include_picture, false) || '): ' || COALESCE(text, '')
+                END,
+                E'\n' ORDER BY rn
+            )
+            FROM numbered
+            """,
+            limit
+        )
 
-            if not rows:
-                return "No previous actions."
-
-            lines = []
-            for i, row in enumerate(reversed(rows), 1):  # Oldest first
-                action_type = row["action_type"]
-                text = row["text"]
-                has_pic = row["include_picture"]
-
-                if action_type == "post":
-                    lines.append(f"{i}. POST (pic: {has_pic}): {text}")
-                elif action_type == "reply":
-                    author = row["reply_to_author"] or "unknown"
-                    lines.append(f"{i}. REPLY to @{author} (pic: {has_pic}): {text}")
-
-            return "\n".join(lines)
+        formatted = history or "No previous actions."
+        self._recent_actions_cache[limit] = formatted
+        return formatted
 
     async def save_action(
         self,
@@ -596,6 +788,7 @@ class Database:
                 action_type, text, tweet_id, include_picture,
                 reply_to_tweet_id, reply_to_author
             )
+            self._recent_actions_cache.clear()
             logger.info(f"Saved action {row['id']}: {action_type} (pic={include_picture})")
             return row["id"]
 
@@ -613,26 +806,25 @@ class Database:
         if not self.pool:
             raise RuntimeError("Database not connected")
 
-        async with self.pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
+        # Formatted in SQL, oldest first
+        history = await self.pool.fetchval(
+            """
+            SELECT string_agg(
+                'You replied to @' || COALESCE(reply_to_author, '') || ': ' || COALESCE(text, ''),
+                E'\n' ORDER BY created_at ASC
+            )
+            FROM (
                 SELECT text, reply_to_author, created_at
                 FROM actions
                 WHERE LOWER(reply_to_author) = LOWER($1) AND action_type = 'reply'
                 ORDER BY created_at DESC
                 LIMIT $2
-                """,
-                author_handle, limit
-            )
-
-            if not rows:
-                return "No previous conversations with this user."
+            ) recent
+            """,
+            author_handle, limit
+        )
 
-            history = []
-            for row in reversed(rows):  # Oldest first
-                history.append(f"You replied to @{row['reply_to_author']}: {row['text']}")
-
-            return "\n".join(history)
+        return history or "No previous conversations with this user."
 
     async def count_actions_today(self, action_type: str | None = None) -> int:
         """
@@ -647,16 +839,14 @@ class Database:
         if not self.pool:
             return 0
 
-        async with self.pool.acquire() as conn:
-            if action_type:
-                return await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM actions
-                    WHERE created_at >= CURRENT_DATE AND action_type = $1
-                    """,
-                    action_type
-                )
-            else:
-                return await conn.fetchval(
-                    "SELECT COUNT(*) FROM actions WHERE created_at >= CURRENT_DATE"
-                )
+        if action_type:
+            return await self.pool.fetchval(
+                """
+                SELECT COUNT(*) FROM actions
+                WHERE created_at >= CURRENT_DATE AND action_type = $1
+                """,
+                action_type
+            )
+        return await self.pool.fetchval(
+            "SELECT COUNT(*) FROM actions WHERE created_at >= CURRENT_DATE"
+        )
@@ -0,0 +1,44 @@
+"""
+Shared HTTP client.
+
+One pooled httpx.AsyncClient for all outbound API calls (OpenRouter LLM,
+web search, image generation), so connections and TLS sessions are reused
+instead of being set up per request.
+"""
+
+import logging
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Default timeout; callers with slower endpoints pass their own per request
+DEFAULT_TIMEOUT = 60.0
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared client, creating it on first use.
+
+    Returns:
+        Process-wide pooled AsyncClient.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+        logger.info("[HTTP] Shared client created")
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared client (application shutdown)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.info("[HTTP] Shared client closed")
+    _client = None
@@ -5,39 +5,207 @@ Provides async interface for text generation with tool calling support.
 Unified client for all LLM interactions in the bot.
 """
 
+import asyncio
 import json
 import logging
+import re
 from typing import Any
 
 import httpx
+import orjson
+from pydantic import ValidationError
 
 from config.models import LLM_MODEL
+from config.personality import SYSTEM_PROMPT_BLOCKS, SYSTEM_PROMPT_STR
+from config.prompts._render import render_system_prompt
+from config.schemas import get_response_model, get_schema_json
+from services.http import get_http_client
+from services.llm_cache import ResponseCache
 from utils.api import OPENROUTER_URL, get_openrouter_headers
+from utils.backoff import RETRYABLE_STATUS, backoff_delay
 
 logger = logging.getLogger(__name__)
 
+# Incremental decoder for the first JSON object embedded in prose
+_JSON_DECODER = json.JSONDecoder()
+
+# Outermost {...} span, for JSON wrapped in prose or code fences
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Whole response wrapped in a ```json ... ``` code fence
+_CODE_FENCE_RE = re.compile(r"^```[a-zA-Z]*\s*(.*?)\s*```$", re.DOTALL)
+
+# Retries for rate-limited / transient 5xx responses
+MAX_RETRIES = 4
+
 
 class LLMClient:
     """Async client for OpenRouter LLM API."""
 
-    def __init__(self, model: str = LLM_MODEL):
+    def __init__(
+        self,
+        model: str = LLM_MODEL,
+        cache_ttl: float | None = None,
+        client: httpx.AsyncClient | None = None
+    ):
+        """
+        Initialize client.
+
+        Args:
+            model: OpenRouter model name.
+            cache_ttl: If set, cache valid structured responses for this many seconds.
+            client: HTTP client to use. Defaults to the shared pooled client.
+        """
         self.model = model
+        self._client = client
+        self.supports_prompt_cache = model.startswith("anthropic/")
+        self.cache = ResponseCache(cache_ttl) if cache_ttl else None
 
     # ---------------------------
     # Internal helpers
     # ---------------------------
 
+    async def _post(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        Send a chat completion request over the pooled HTTP client.
+
+        Rate limits (429) and transient 5xx responses are retried with
+        jittered exponential backoff; other errors are raised immediately.
+        """
+        client = self._client or get_http_client()
+        # Serialized once (orjson emits the UTF-8 body directly) and reused by retries
+        body = orjson.dumps(payload)
+        for attempt in range(MAX_RETRIES + 1):
+            response = await client.post(
+                OPENROUTER_URL,
+                headers=get_openrouter_headers(),
+                content=body,
+                timeout=60.0
+            )
+            if response.status_code not in RETRYABLE_STATUS or attempt == MAX_RETRIES:
+                break
+
+            delay = backoff_delay(attempt)
+            logger.warning(
+                "[LLM] HTTP %d, retrying in %.1fs (%d/%d)",
+                response.status_code, delay, attempt + 1, MAX_RETRIES
+            )
+            await asyncio.sleep(delay)
+
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     def _safe_json_parse(self, text: str) -> Any:
         """
         Safely attempt to parse JSON from model output.
 
-        Returns parsed object or None if parsing fails.
+        When the model wraps JSON in extra text, decodes the first object
+        starting at the first "{", then falls back to the outermost {...}
+        span. Returns parsed object or None if parsing fails.
         """
         try:
-            return json.loads(text)
+            return orjson.loads(text)
+        except Exception:
+            pass
+
+        # Decode the first complete object after the first "{", ignoring
+        # whatever prose follows it
+        start = (text or "").find("{")
+        if start < 0:
+            return None
+
+        try:
+            return _JSON_DECODER.raw_decode(text, start)[0]
+        except ValueError:
+            pass
+
+        # Last resort: outermost {...} span
+        match = _JSON_OBJ_RE.search(text, start)
+        if not match:
+            return None
+
+        try:
+            return orjson.loads(match.group(0))
         except Exception:
             return None
 
+    def _system_content(self, system: str | list[str] | tuple[str, ...]) -> str | list[dict[str, Any]]:
+        """
+        Build system message content.
+
+        The system prompt may be passed as a list of segments ordered from
+        most to least static (e.g. personality, instructions, tools). For
+        Anthropic models each segment ends with a cache_control breakpoint,
+        so a change in a later segment doesn't invalidate earlier ones.
+        Other providers receive the joined string.
+        """
+        if isinstance(system, (list, tuple)):
+            return render_system_prompt(tuple(system), self.supports_prompt_cache)
+
+        if not self.supports_prompt_cache or not system.startswith(SYSTEM_PROMPT_STR):
+            return system
+
+        blocks = list(SYSTEM_PROMPT_BLOCKS)
+        rest = system[len(SYSTEM_PROMPT_STR):]
+        if rest:
+            blocks.append({"type": "text", "text": rest})
+        return blocks
+
+    def _prepare_messages(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Apply provider-specific system prompt formatting to a message list."""
+        return [
+            {**m, "content": self._system_content(m["content"])}
+            if m.get("role") == "system" and isinstance(m.get("content"), (str, list, tuple))
+            else m
+            for m in messages
+        ]
+
+    def _cache_key(self, messages: list[dict[str, Any]], response_format: dict[str, Any]) -> bytes:
+        """Build response cache key from model, conversation and schema."""
+        schema_name = response_format.get("json_schema", {}).get("name", "")
+        return ResponseCache.make_key(
+            self.model,
+            # orjson emits UTF-8 bytes directly, no intermediate str
+            orjson.dumps(messages, option=orjson.OPT_SORT_KEYS),
+            get_schema_json(schema_name) or orjson.dumps(response_format, option=orjson.OPT_SORT_KEYS)
+        )
+
+    def _parse_structured(
+        self,
+        raw_content: str,
+        response_format: dict[str, Any]
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Parse structured output and report whether it matches the schema.
+
+        A surrounding code fence is stripped first. Static schemas are then
+        decoded and validated in one pass by their response model; other
+        schemas fall back to orjson.loads and count as valid for any dict.
+
+        Returns:
+            (result dict, schema_valid). Invalid output still yields a
+            best-effort dict via _normalize_structured_response.
+        """
+        schema_name = response_format.get("json_schema", {}).get("name", "")
+        model = get_response_model(schema_name)
+
+        # Unwrap fenced output first so it can still validate in one pass
+        fenced = _CODE_FENCE_RE.match(raw_content.strip())
+        if fenced:
+            raw_content = fenced.group(1)
+
+        if model:
+            try:
+                return model.model_validate_json(raw_content).model_dump(exclude_unset=True), True
+            except ValidationError:
+                pass
+
+        parsed = self._safe_json_parse(raw_content)
+        if isinstance(parsed, dict):
+            return parsed, model is None
+
+        return self._normalize_structured_response(raw_content, response_format), False
+
     def _normalize_structured_response(
         self,
         raw_content: str,
@@ -57,18 +225,21 @@ class LLMClient:
 
         # Best-effort fallback depending on schema intent
         # Common patterns in your system
-        if "plan" in json.dumps(response_format):
+        schema_name = response_format.get("json_schema", {}).get("name", "")
+        schema_json = get_schema_json(schema_name) or orjson.dumps(response_format).decode()
+
+        if "plan" in schema_json:
             return {
                 "reasoning": raw_content.strip(),
                 "plan": []
             }
 
-        if "post_text" in json.dumps(response_format) or "post" in json.dumps(response_format):
+        if "post_text" in schema_json or "post" in schema_json:
             return {
                 "post_text": raw_content.strip()
             }
 
-        if "thinking" in json.dumps(response_format):
+        if "thinking" in schema_json:
             return {
                 "thinking": raw_content.strip()
             }
@@ -80,35 +251,28 @@ class LLMClient:
     # Public API
     # ---------------------------
 
-    async def generate(self, system: str, user: str) -> str:
+    async def generate(self, system: str | list[str], user: str) -> str:
         """
         Simple text generation (no schema).
         """
         messages = [
-            {"role": "system", "content": system},
+            {"role": "system", "content": self._system_content(system)},
             {"role": "user", "content": user}
         ]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers=get_openrouter_headers(),
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "max_tokens": 500
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = await self._post({
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": 500
+        })
 
-            content = data["choices"][0]["message"]["content"]
-            logger.info(f"[LLM] Generated response: {content[:100]}...")
-            return content
+        content = data["choices"][0]["message"]["content"]
+        logger.info("[LLM] Generated response: %s...", content[:100])
+        return content
 
     async def generate_structured(
         self,
-        system: str,
+        system: str | list[str],
         user: str,
         response_format: dict[str, Any]
     ) -> dict[str, Any]:
@@ -116,59 +280,83 @@ class LLMClient:
         Generate structured JSON output with hard safety.
         """
         messages = [
-            {"role": "system", "content": system},
+            {"role": "system", "content": self._system_content(system)},
             {"role": "user", "content": user}
         ]
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers=get_openrouter_headers(),
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "max_tokens": 500,
-                    "response_format": response_format
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        cache_key = None
+        if self.cache:
+            cache_key = self._cache_key(messages, response_format)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("[LLM] Structured response served from cache")
+                return cached
+
+        data = await self._post({
+            "model": self.model,
+            "messages": messages,
+            "max_tokens": 500,
+            "response_format": response_format
+        })
 
-            raw = data["choices"][0]["message"]["content"]
-            logger.info(f"[LLM] Generated structured response (raw): {raw[:200]}")
+        raw = data["choices"][0]["message"]["content"]
+        logger.info("[LLM] Generated structured response (raw): %s", raw[:200])
 
-            return self._normalize_structured_response(raw, response_format)
+        result, valid = self._parse_structured(raw, response_format)
+
+        # Only cache schema-valid responses (not text fallbacks or partial objects)
+        if cache_key and valid:
+            self.cache.set(cache_key, result)
+
+        return result
 
     async def chat(
         self,
         messages: list[dict[str, Any]],
-        response_format: dict[str, Any] | None = None
+        response_format: dict[str, Any] | None = None,
+        max_tokens: int = 1024
     ) -> dict[str, Any]:
         """
         Multi-turn chat completion with schema tolerance.
+
+        Args:
+            messages: Conversation messages.
+            response_format: Optional structured output schema.
+            max_tokens: Generation cap; short outputs (a single tweet) can
+                pass a lower value to bound server-side generation.
+
+        Returns:
+            Parsed structured response, or {"content": raw} without a schema.
         """
         payload = {
             "model": self.model,
-            "messages": messages,
-            "max_tokens": 1024
+            "messages": self._prepare_messages(messages),
+            "max_tokens": max_tokens
         }
 
         if response_format:
             payload["response_format"] = response_format
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers=get_openrouter_headers(),
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
+        cache_key = None
+        if self.cache and response_format:
+            cache_key = self._cache_key(payload["messages"], response_format)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("[LLM] Chat response served from cache")
+                return cached
+
+        data = await self._post(payload)
+
+        raw = data["choices"][0]["message"]["content"]
+        logger.info("[LLM] Chat response (raw): %s...", raw[:200])
+
+        if response_format:
+            result, valid = self._parse_structured(raw, response_format)
 
-            raw = data["choices"][0]["message"]["content"]
-            logger.info(f"[LLM] Chat response (raw): {raw[:200]}...")
+            # Only cache schema-valid responses (not text fallbacks or partial objects)
+            if cache_key and valid:
+                self.cache.set(cache_key, result)
 
-            if response_format:
-                return self._normalize_structured_response(raw, response_format)
+            return result
 
-            return {"content": raw}
+        return {"content": raw}
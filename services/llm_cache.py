@@ -0,0 +1,66 @@
+"""
+In-process response cache for LLM calls.
+
+Exact-match cache keyed on a hash of the request inputs. Lets repeated
+identical requests (duplicate mentions, retries after transient failures)
+skip the LLM round-trip entirely.
+"""
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class ResponseCache:
+    """TTL + LRU bounded cache of parsed LLM responses."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            ttl_seconds: How long an entry stays valid.
+            max_entries: Oldest entries are evicted beyond this size.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, tuple[float, Any]] = OrderedDict()
+
+    @staticmethod
+    def make_key(*parts: str | bytes) -> bytes:
+        """
+        Build a cache key from request inputs.
+
+        Returns a 16-byte blake2b digest, so large inputs (full conversations
+        with previous posts) are compared and stored as a fixed-size key.
+        Bytes parts are hashed as-is, skipping a UTF-8 encode.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Any | None:
+        """Get a copy of a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        # Callers may mutate responses (e.g. sort lists), so hand out copies
+        return copy.deepcopy(value)
+
+    def set(self, key: bytes, value: Any) -> None:
+        """Store a value for ttl_seconds."""
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
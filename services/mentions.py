@@ -10,15 +10,17 @@ Processes Twitter mentions using autonomous agent architecture:
    - Post reply
 """
 
-import json
+import asyncio
 import logging
 import time
 from typing import Any
 
+import orjson
+
 from services.database import Database
 from services.llm import LLMClient
-from services.twitter import TwitterClient
-from tools.registry import TOOLS, get_tools_description
+from services.twitter import get_twitter_client
+from tools.registry import REACTION_TOOLS, TOOLS, get_tools_description
 from config.personality import SYSTEM_PROMPT
 from config.prompts.mention_selector_agent import MENTION_SELECTOR_AGENT_PROMPT
 from config.prompts.mention_reply_agent import MENTION_REPLY_AGENT_PROMPT
@@ -28,6 +30,7 @@ from config.schemas import (
     REPLY_TEXT_SCHEMA,
     TOOL_REACTION_SCHEMA
 )
+from utils.tasks import discard_task
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +45,8 @@ class MentionAgentHandler:
     def __init__(self, db: Database, tier_manager=None):
         """Initialize mention agent handler."""
         self.db = db
-        self.llm = LLMClient()
-        self.twitter = TwitterClient()
+        self.llm = LLMClient(cache_ttl=300)
+        self.twitter = get_twitter_client()
         self.tier_manager = tier_manager
 
     def _validate_plan(self, plan: list[dict]) -> None:
@@ -223,7 +226,7 @@ class MentionAgentHandler:
         mentions_text = self._format_mentions_for_llm(mentions)
         recent_replies = await self.db.get_recent_mentions_formatted(limit=10)
 
-        system_prompt = SYSTEM_PROMPT + MENTION_SELECTOR_AGENT_PROMPT
+        system_prompt = [SYSTEM_PROMPT, MENTION_SELECTOR_AGENT_PROMPT]
 
         user_prompt = f"""Here are the mentions waiting for your response:
 
@@ -296,80 +299,104 @@ Select which mentions to reply to. You can select multiple, one, or none."""
             image_bytes = None
             tools_used = []
             messages = self._build_initial_messages(mention, selection, user_history)
-            messages.append({"role": "assistant", "content": json.dumps(plan_result)})
-
-            for i, step in enumerate(plan):
-                tool_name = step["tool"]
-                params = step["params"]
-                tools_used.append(tool_name)
-
-                if tool_name not in TOOLS:
-                    logger.warning(f"[MENTIONS] @{author_handle}: Unknown tool: {tool_name}")
-                    continue
-
-                if tool_name == "web_search":
-                    query = params.get("query", "")
-                    logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] web_search - query: {query[:40]}...")
-
-                    result = await TOOLS[tool_name](query)
-
-                    if result.get("error"):
-                        logger.warning(f"[MENTIONS] @{author_handle}: web_search: FAILED")
-                        messages.append({"role": "user", "content": f"Tool result (web_search): {result['content']}"})
-                    else:
-                        logger.info(f"[MENTIONS] @{author_handle}: web_search: OK ({len(result['sources'])} sources)")
-                        messages.append({"role": "user", "content": f"Tool result (web_search):\n{result['content']}"})
-
-                elif tool_name == "generate_image":
-                    prompt = params.get("prompt", "")
-                    logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] generate_image - prompt: {prompt[:40]}...")
-
-                    image_bytes = await TOOLS[tool_name](prompt)
-
-                    if image_bytes:
-                        logger.info(f"[MENTIONS] @{author_handle}: generate_image: OK ({len(image_bytes)} bytes)")
-                        messages.append({"role": "user", "content": "Tool result (generate_image): Image generated successfully."})
-                    else:
-                        logger.warning(f"[MENTIONS] @{author_handle}: generate_image: FAILED - continuing without image")
-                        messages.append({"role": "user", "content": "Tool result (generate_image): Failed. Continue without image."})
-
-                # Step-by-step: LLM reacts to tool result
-                logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] Getting LLM reaction...")
-                reaction = await self.llm.chat(messages, TOOL_REACTION_SCHEMA)
-                thinking = reaction.get("thinking", "")
-                logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] Thinking: {thinking[:80]}...")
-                messages.append({"role": "assistant", "content": thinking})
-
-            # LLM #3: Generate reply
-            logger.info(f"[MENTIONS] @{author_handle}: Generating reply...")
-            messages.append({
-                "role": "user",
-                "content": "Now write your final reply (max 280 characters)."
-            })
-
-            reply_result = await self.llm.chat(messages, REPLY_TEXT_SCHEMA)
-            reply_text = reply_result.get("reply_text", "").strip()
-
-            if not reply_text:
-                logger.warning(f"[MENTIONS] @{author_handle}: Empty reply generated")
-                return {"success": False, "error": "empty_reply", "tweet_id": tweet_id}
-
-            # Truncate if needed
-            if len(reply_text) > 280:
-                reply_text = reply_text[:277] + "..."
-
-            logger.info(f"[MENTIONS] @{author_handle}: Reply: {reply_text[:50]}... ({len(reply_text)} chars)")
-
-            # Upload image if generated
-            media_ids = None
-            if image_bytes:
-                try:
-                    media_id = await self.twitter.upload_media(image_bytes)
-                    media_ids = [media_id]
-                    logger.info(f"[MENTIONS] @{author_handle}: Image uploaded")
-                except Exception as e:
-                    logger.error(f"[MENTIONS] @{author_handle}: Image upload FAILED: {e}")
-                    image_bytes = None
+            messages.append({"role": "assistant", "content": orjson.dumps(plan_result).decode()})
+
+            # generate_image is always the last step (see _validate_plan) and its
+            # prompt comes from the plan, so start it now: it runs while earlier
+            # steps and their reaction calls are in flight
+            image_task = None
+            if plan and plan[-1]["tool"] == "generate_image" and "generate_image" in TOOLS:
+                image_task = asyncio.create_task(TOOLS["generate_image"](plan[-1]["params"].get("prompt", "")))
+
+            try:
+                # Index of the last non-image step: the reply call reads its result
+                # directly, so a reaction to it would be a round-trip nothing consumes
+                last_info_step = len(plan) - 2 if plan and plan[-1]["tool"] == "generate_image" else len(plan) - 1
+
+                for i, step in enumerate(plan):
+                    tool_name = step["tool"]
+                    params = step["params"]
+                    tools_used.append(tool_name)
+
+                    if tool_name not in TOOLS:
+                        logger.warning(f"[MENTIONS] @{author_handle}: Unknown tool: {tool_name}")
+                        continue
+
+                    if tool_name == "web_search":
+                        query = params.get("query", "")
+                        logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] web_search - query: {query[:40]}...")
+
+                        result = await TOOLS[tool_name](query)
+
+                        if result.get("error"):
+                            logger.warning(f"[MENTIONS] @{author_handle}: web_search: FAILED")
+                            messages.append({"role": "user", "content": f"Tool result (web_search): {result['content']}"})
+                        else:
+                            logger.info(f"[MENTIONS] @{author_handle}: web_search: OK ({len(result['sources'])} sources)")
+                            messages.append({"role": "user", "content": f"Tool result (web_search):\n{result['content']}"})
+
+                    elif tool_name == "generate_image":
+                        prompt = params.get("prompt", "")
+                        logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] generate_image - prompt: {prompt[:40]}...")
+
+                        image_bytes = await image_task
+
+                        if image_bytes:
+                            logger.info(f"[MENTIONS] @{author_handle}: generate_image: OK ({len(image_bytes)} bytes)")
+                            messages.append({"role": "user", "content": "Tool result (generate_image): Image generated successfully."})
+                        else:
+                            logger.warning(f"[MENTIONS] @{author_handle}: generate_image: FAILED - continuing without image")
+                            messages.append({"role": "user", "content": "Tool result (generate_image): Failed. Continue without image."})
+
+                    # Step-by-step: LLM reacts to search results only; an image result
+                    # carries nothing to interpret, so the reply call absorbs it
+                    if tool_name in REACTION_TOOLS and i < last_info_step:
+                        logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] Getting LLM reaction...")
+                        reaction = await self.llm.chat(messages, TOOL_REACTION_SCHEMA)
+                        thinking = reaction.get("thinking", "")
+                        logger.info(f"[MENTIONS] @{author_handle}: [{i+1}/{len(plan)}] Thinking: {thinking[:80]}...")
+                        messages.append({"role": "assistant", "content": thinking})
+            finally:
+                # Don't leave image generation running if an earlier step raised
+                discard_task(image_task)
+
+            # Start the media upload now so it overlaps with the reply LLM call
+            upload_task = asyncio.create_task(self.twitter.upload_media(image_bytes)) if image_bytes else None
+
+            try:
+                # LLM #3: Generate reply
+                logger.info(f"[MENTIONS] @{author_handle}: Generating reply...")
+                messages.append({
+                    "role": "user",
+                    "content": "Now write your final reply (max 280 characters)."
+                })
+
+                reply_result = await self.llm.chat(messages, REPLY_TEXT_SCHEMA)
+                reply_text = reply_result.get("reply_text", "").strip()
+
+                if not reply_text:
+                    logger.warning(f"[MENTIONS] @{author_handle}: Empty reply generated")
+                    return {"success": False, "error": "empty_reply", "tweet_id": tweet_id}
+
+                # Truncate if needed
+                if len(reply_text) > 280:
+                    reply_text = reply_text[:277] + "..."
+
+                logger.info(f"[MENTIONS] @{author_handle}: Reply: {reply_text[:50]}... ({len(reply_text)} chars)")
+
+                # Collect the image upload started before the reply call
+                media_ids = None
+                if upload_task:
+                    try:
+                        media_id = await upload_task
+                        media_ids = [media_id]
+                        logger.info(f"[MENTIONS] @{author_handle}: Image uploaded")
+                    except Exception as e:
+                        logger.error(f"[MENTIONS] @{author_handle}: Image upload FAILED: {e}")
+                        image_bytes = None
+            finally:
+                # Don't leave the upload running on an empty reply or if the reply call raised
+                discard_task(upload_task)
 
             # Post reply
             await self.twitter.reply(reply_text, tweet_id, media_ids=media_ids)
@@ -421,7 +448,7 @@ Select which mentions to reply to. You can select multiple, one, or none."""
         author_text = mention["text"]
 
         tools_desc = get_tools_description()
-        system_prompt = SYSTEM_PROMPT + MENTION_REPLY_AGENT_PROMPT + f"\n\n{tools_desc}"
+        system_prompt = [SYSTEM_PROMPT, MENTION_REPLY_AGENT_PROMPT, tools_desc]
 
         user_prompt = f"""@{author_handle} mentioned you: {author_text}
 
@@ -457,7 +484,7 @@ Create your plan. What tools do you need (if any)?"""
         author_text = mention["text"]
 
         tools_desc = get_tools_description()
-        system_prompt = SYSTEM_PROMPT + MENTION_REPLY_AGENT_PROMPT + f"\n\n{tools_desc}"
+        system_prompt = [SYSTEM_PROMPT, MENTION_REPLY_AGENT_PROMPT, tools_desc]
 
         return [
             {"role": "system", "content": system_prompt},
@@ -4,6 +4,7 @@ Twitter client using tweepy for Twitter API v2.
 Handles posting tweets, replies, media uploads, and fetching mentions.
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -15,7 +16,13 @@ logger = logging.getLogger(__name__)
 
 
 class TwitterClient:
-    """Twitter API v2 client using tweepy."""
+    """
+    Twitter API v2 client using tweepy.
+
+    tweepy is synchronous (and sleeps in-thread when rate limited), so the
+    async methods run their API calls in a worker thread instead of
+    blocking the event loop.
+    """
 
     def __init__(self):
         """Initialize Twitter client with credentials from settings."""
@@ -54,7 +61,8 @@ class TwitterClient:
             Tweet data including id and text.
         """
         try:
-            response = self.client.create_tweet(
+            response = await asyncio.to_thread(
+                self.client.create_tweet,
                 text=text,
                 media_ids=media_ids
             )
@@ -83,7 +91,8 @@ class TwitterClient:
             Reply tweet data including id and text.
         """
         try:
-            response = self.client.create_tweet(
+            response = await asyncio.to_thread(
+                self.client.create_tweet,
                 text=text,
                 in_reply_to_tweet_id=reply_to_tweet_id,
                 media_ids=media_ids
@@ -99,7 +108,9 @@ class TwitterClient:
         """
         Upload media to Twitter.
 
-        Uses v1.1 API as v2 doesn't support media uploads yet.
+        Uses v1.1 API as v2 doesn't support media uploads yet. The blocking
+        tweepy call runs in a worker thread so the upload can overlap with
+        other work on the event loop.
 
         Args:
             image_bytes: Raw image bytes to upload.
@@ -115,7 +126,7 @@ class TwitterClient:
             file_obj.name = "image.png"
 
             # Upload using v1.1 API
-            media = self.api_v1.media_upload(filename="image.png", file=file_obj)
+            media = await asyncio.to_thread(self.api_v1.media_upload, filename="image.png", file=file_obj)
             media_id = str(media.media_id)
             logger.info(f"Uploaded media with ID {media_id}")
             return media_id
@@ -224,3 +235,22 @@ class TwitterClient:
         except Exception as e:
             logger.error(f"Error getting profile @{username}: {e}")
             return None
+
+
+_shared_client: TwitterClient | None = None
+
+
+def get_twitter_client() -> TwitterClient:
+    """
+    Get the process-wide TwitterClient, creating it on first use.
+
+    Services share one instance so tweepy's HTTP sessions (and their
+    keep-alive connections) are reused instead of duplicated per service.
+
+    Returns:
+        Shared TwitterClient.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = TwitterClient()
+    return _shared_client
@@ -5,15 +5,18 @@ Single agent that handles both posting and replying using Structured Output.
 Replaces separate autopost and mentions services.
 """
 
-import json
+import asyncio
 import logging
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from services.database import Database
 from services.llm import LLMClient
-from services.twitter import TwitterClient
+from services.twitter import get_twitter_client
 from tools.registry import (
     get_tools_for_mode,
     get_tools_description_for_mode,
@@ -21,8 +24,7 @@ from tools.registry import (
     get_tools_params_schema,
     get_tool_func
 )
-from config.personality import SYSTEM_PROMPT
-from config.prompts.unified_agent import AGENT_INSTRUCTIONS
+from config.prompts import build_system_segments
 from config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -32,12 +34,21 @@ def build_step_decision_schema(tier: str) -> dict:
     """
     Build JSON schema for agent step decision dynamically from registry.
 
+    Built once per tier and tool set; callers must not mutate the result.
+
     Args:
         tier: "free" or "basic+"
 
     Returns:
         JSON schema for structured output.
     """
+    # The (cached) tools description changes exactly when the tool set does,
+    # so it keys the schema cache and refresh_tools() still takes effect
+    return _build_step_decision_schema(tier, get_tools_description_for_mode("unified", tier))
+
+
+@lru_cache(maxsize=4)
+def _build_step_decision_schema(tier: str, tools_desc: str) -> dict:
     tools_enum = get_tools_enum_for_mode("unified", tier)
     params_schema = get_tools_params_schema()
 
@@ -83,7 +94,7 @@ class UnifiedAgent:
     def __init__(self, db: Database, tier_manager=None):
         self.db = db
         self.llm = LLMClient()
-        self.twitter = TwitterClient()
+        self.twitter = get_twitter_client()
         self.tier_manager = tier_manager
 
         # Tracking for this cycle
@@ -100,12 +111,12 @@ class UnifiedAgent:
 
     async def _build_context(self) -> str:
         """Build context string for the agent."""
-        # Get recent actions
-        recent_actions = await self.db.get_recent_actions_formatted(limit=20)
-
-        # Get rate limits (tier-based)
-        posts_today = await self.db.count_actions_today("post")
-        replies_today = await self.db.count_actions_today("reply")
+        # Recent actions + today's counts for rate limits: independent queries, fetched concurrently
+        recent_actions, posts_today, replies_today = await asyncio.gather(
+            self.db.get_recent_actions_formatted(limit=20),
+            self.db.count_actions_today("post"),
+            self.db.count_actions_today("reply")
+        )
 
         daily_post_limit, daily_reply_limit = self.tier_manager.get_daily_limits()
 
@@ -206,20 +217,8 @@ class UnifiedAgent:
             # Build context
             context = await self._build_context()
 
-            # Build system prompt
-            system_prompt = f"""{SYSTEM_PROMPT}
-
----
-
-{AGENT_INSTRUCTIONS}
-
----
-
-{tools_desc}
-
----
-
-{context}"""
+            # Build system prompt segments (static prefix first, per-cycle context last)
+            system_prompt = build_system_segments(tools_desc, context)
 
             # Initialize conversation
             messages = [
@@ -244,7 +243,7 @@ class UnifiedAgent:
                 logger.info(f"[AGENT] [{iteration}/{max_iterations}] Tool: {tool_name}")
 
                 # Add assistant response to messages
-                messages.append({"role": "assistant", "content": json.dumps(result)})
+                messages.append({"role": "assistant", "content": orjson.dumps(result).decode()})
 
                 # Execute tool
                 tool_result = await self._execute_tool(tool_name, params)
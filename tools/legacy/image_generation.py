@@ -12,9 +12,11 @@ import logging
 from pathlib import Path
 
 import httpx
+import orjson
 
 from config.models import IMAGE_MODEL
 from config.settings import settings
+from services.http import get_http_client
 from utils.api import OPENROUTER_URL, get_openrouter_headers
 
 logger = logging.getLogger(__name__)
@@ -133,14 +135,16 @@ async def generate_image(prompt: str, **kwargs) -> bytes | None:
     logger.info(f"[IMAGE_GEN] Sending request to OpenRouter")
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers=get_openrouter_headers(),
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.post(
+            OPENROUTER_URL,
+            headers=get_openrouter_headers(),
+            # orjson emits the UTF-8 body directly
+            content=orjson.dumps(payload),
+            timeout=120.0
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         logger.info(f"[IMAGE_GEN] Response received")
 
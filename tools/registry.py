@@ -14,6 +14,7 @@ Each tool file should export:
 import importlib
 import logging
 import pkgutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -27,6 +28,8 @@ IMAGE_TOOLS = {"generate_image"}
 IMAGE_PARAMS = {"include_image"}
 # Tools that require mentions to be enabled
 MENTION_TOOLS = {"get_mentions", "create_reply"}
+# Tools whose results get a separate "reaction" LLM call in the legacy agents
+REACTION_TOOLS = {"web_search"}
 
 
 def _discover_tools_from_folder(folder_name: str) -> dict[str, dict]:
@@ -136,10 +139,14 @@ def get_tool_func(name: str) -> Callable | None:
     return None
 
 
+@lru_cache(maxsize=8)
 def get_tools_description_for_mode(mode: str, tier: str = "basic+") -> str:
     """
     Generate human-readable tools description for prompts.
 
+    Cached per (mode, tier): the tool set only changes on deploy or
+    refresh_tools(), which clears the cache.
+
     Args:
         mode: "legacy" or "unified"
         tier: "free" or "basic+"
@@ -232,7 +239,19 @@ def get_tools_description() -> str:
 
 
 def refresh_tools() -> None:
-    """Re-discover tools (useful if tools are added at runtime)."""
-    global ALL_TOOLS, TOOLS
-    ALL_TOOLS = _discover_all_tools()
-    TOOLS = {name: tool["func"] for name, tool in get_tools_for_mode("legacy").items()}
+    """
+    Re-discover tools (useful if tools are added at runtime).
+
+    ALL_TOOLS and TOOLS are updated in place, so modules that imported them
+    by name see the new tools, and the cached descriptions (and the prompts
+    memoized on them) are invalidated.
+    """
+    discovered = _discover_all_tools()
+    ALL_TOOLS.clear()
+    ALL_TOOLS.update(discovered)
+
+    legacy = {name: tool["func"] for name, tool in get_tools_for_mode("legacy").items()}
+    TOOLS.clear()
+    TOOLS.update(legacy)
+
+    get_tools_description_for_mode.cache_clear()
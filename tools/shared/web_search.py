@@ -9,8 +9,10 @@ import logging
 from typing import Any
 
 import httpx
+import orjson
 
 from config.models import LLM_MODEL
+from services.http import get_http_client
 from utils.api import OPENROUTER_URL, get_openrouter_headers
 
 logger = logging.getLogger(__name__)
@@ -56,14 +58,16 @@ async def web_search(query: str, **kwargs) -> str:
     }
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                OPENROUTER_URL,
-                headers=get_openrouter_headers(),
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_http_client()
+        response = await client.post(
+            OPENROUTER_URL,
+            headers=get_openrouter_headers(),
+            # orjson emits the UTF-8 body directly
+            content=orjson.dumps(payload),
+            timeout=60.0
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         logger.info(f"[WEB_SEARCH] Response received")
 
@@ -8,6 +8,7 @@ import logging
 
 from tools.legacy.image_generation import generate_image
 from config.settings import settings
+from utils.dedupe import tweet_history
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,10 @@ async def create_post(text: str, include_image: bool = False, twitter=None, db=N
     if len(text) > 280:
         text = text[:277] + "..."
 
+    # Reject near-copies of earlier tweets so the agent writes something new
+    if tweet_history.is_duplicate(text):
+        return "Error: Too similar to a tweet you already made. Write something more original."
+
     # Generate image if requested
     media_ids = None
     image_generated = False
@@ -94,6 +99,8 @@ async def create_post(text: str, include_image: bool = False, twitter=None, db=N
         logger.error(f"[CREATE_POST] Post failed: {e}")
         return f"Error posting: {e}"
 
+    tweet_history.add(text)
+
     # Save to database
     await db.save_action(
         action_type="post",
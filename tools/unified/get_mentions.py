@@ -68,23 +68,23 @@ async def get_mentions(twitter=None, db=None, tier_manager=None, **kwargs) -> st
         if not mentions:
             return "No new mentions from whitelisted users."
 
-    # Filter out already processed
+    # Filter out already processed (one query for the whole batch)
+    processed = await db.get_processed_mention_ids([m["id_str"] for m in mentions])
+
     unprocessed = []
+    pending = []
     for mention in mentions:
         tweet_id = mention["id_str"]
-        if not await db.mention_exists(tweet_id):
-            author = mention["user"]["screen_name"]
-            text = mention["text"]
-            unprocessed.append(f"- tweet_id: {tweet_id}\n  from: @{author}\n  text: {text}")
-
-            # Save to DB as pending (so we have author_text for history)
-            await db.save_mention(
-                tweet_id=tweet_id,
-                author_handle=author,
-                author_text=text,
-                our_reply=None,
-                action="pending"
-            )
+        if tweet_id in processed:
+            continue
+
+        author = mention["user"]["screen_name"]
+        text = mention["text"]
+        unprocessed.append(f"- tweet_id: {tweet_id}\n  from: @{author}\n  text: {text}")
+        pending.append((tweet_id, author, text))
+
+    # Save to DB as pending (so we have author_text for history)
+    await db.save_pending_mentions(pending)
 
     if not unprocessed:
         return "No new unprocessed mentions."
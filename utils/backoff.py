@@ -0,0 +1,27 @@
+"""
+Jittered exponential backoff.
+
+Shared delay calculation for retrying transient API failures (rate limits,
+5xx) without every caller retrying in lockstep.
+"""
+
+import random
+
+# HTTP statuses worth retrying: rate limited or transient server errors
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """
+    Get the delay before the next retry.
+
+    Args:
+        attempt: Zero-based retry attempt number.
+        base: Delay for the first retry, in seconds.
+        cap: Upper bound on the delay, in seconds.
+
+    Returns:
+        Random delay in [d, 2d] where d = base * 2**attempt, capped at cap.
+    """
+    delay = min(cap, base * (2 ** attempt))
+    return min(cap, random.uniform(delay, delay * 2))
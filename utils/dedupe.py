@@ -0,0 +1,97 @@
+"""
+Near-duplicate detection for generated tweets.
+
+Uses a 64-bit SimHash over word 3-grams. A candidate within a small
+Hamming distance of a known tweet is treated as a repeat, which replaces
+stuffing every previous tweet into the system prompt.
+"""
+
+import hashlib
+import re
+from typing import Iterable
+
+from config.personality.sample_tweets import SAMPLE_TWEETS_LIST
+
+# Number of bits in a SimHash fingerprint
+SIMHASH_BITS = 64
+
+# Fingerprints closer than this are considered near-duplicates
+DEFAULT_MAX_DISTANCE = 8
+
+# Bracketed annotations like "[image: ...]" are not part of the tweet voice
+_ANNOTATION_RE = re.compile(r"\[[^\]]*\]")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _shingles(text: str, size: int = 3) -> list[str]:
+    """Split text into lowercase word n-grams."""
+    # Plain C-level scan first: most tweets have no brackets, so skip the regex
+    if "[" in text:
+        text = _ANNOTATION_RE.sub(" ", text)
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return [" ".join(words)] if words else []
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def simhash(text: str) -> int:
+    """
+    Compute a 64-bit SimHash fingerprint of text.
+
+    Args:
+        text: Tweet text.
+
+    Returns:
+        Fingerprint as an int (0 for text without words).
+    """
+    weights = [0] * SIMHASH_BITS
+
+    for shingle in _shingles(text):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two fingerprints."""
+    return (a ^ b).bit_count()
+
+
+class TweetDeduplicator:
+    """Set of tweet fingerprints with near-duplicate lookup."""
+
+    def __init__(self, tweets: Iterable[str] = (), max_distance: int = DEFAULT_MAX_DISTANCE):
+        self.max_distance = max_distance
+        self.fingerprints: set[int] = set()
+        for tweet in tweets:
+            self.add(tweet)
+
+    def add(self, text: str) -> None:
+        """Remember a tweet so later near-copies are rejected."""
+        fingerprint = simhash(text)
+        if fingerprint:
+            self.fingerprints.add(fingerprint)
+
+    def is_duplicate(self, text: str) -> bool:
+        """Check whether text is a near-copy of a remembered tweet."""
+        return self.is_duplicate_fingerprint(simhash(text))
+
+    def is_duplicate_fingerprint(self, fingerprint: int) -> bool:
+        """Like is_duplicate, for a precomputed simhash() fingerprint."""
+        if not fingerprint:
+            return False
+        return any(
+            hamming_distance(fingerprint, known) < self.max_distance
+            for known in self.fingerprints
+        )
+
+
+# Shared history: seeded with the sample tweets here, and with recent posts
+# from the database at application startup (see main.lifespan)
+tweet_history = TweetDeduplicator(SAMPLE_TWEETS_LIST)
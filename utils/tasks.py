@@ -0,0 +1,29 @@
+"""
+Helpers for tasks started ahead of the point where their result is needed.
+
+Work such as image generation and media uploads is started early so it
+overlaps with LLM calls. If the code in between raises, the task must be
+cleaned up rather than left running with nobody awaiting it.
+"""
+
+import asyncio
+
+
+def discard_task(task: asyncio.Task | None) -> None:
+    """
+    Cancel a task whose result will not be consumed.
+
+    A task that is still running is cancelled. A task that already failed
+    has its exception retrieved, so asyncio doesn't log "Task exception was
+    never retrieved".
+
+    Args:
+        task: Task to discard (None is ignored).
+    """
+    if task is None:
+        return
+
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()